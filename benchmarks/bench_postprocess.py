@@ -0,0 +1,98 @@
+"""Per-row vs vectorized post-processing at 100k rows.
+
+Run from the repository root: python benchmarks/bench_postprocess.py [rows]
+Fails loudly if the vectorized output differs from the per-row helpers.
+"""
+from __future__ import annotations
+
+import os
+import random
+import sys
+import time
+
+import pandas as pd
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+import linkedin_scraper as ls  # noqa: E402
+
+AGES = [
+    "Just posted", "Today", "30 minutes ago", "5 hours ago", "1 day ago", "3 days ago", "2 weeks ago",
+    "Within 5 days (search-filtered)", "last 5 days", "Posted 24 hours ago", "Reposted", "", None,
+    # Non-ASCII digits: Python's \d matches them, RE2's does not.
+    "\u0663 days ago", "\u0968 hours ago", "\uff11 week ago",
+]
+LOCATIONS = [
+    "New Delhi, Delhi, India", "Noida, Uttar Pradesh", "Gurugram, Haryana", "Greater Delhi Area",
+    "Mumbai, Maharashtra", "Bengaluru", "Remote", "", None,
+]
+PHONES = [
+    "+91 98765 43210", "9876543210", "(011) 2345-6789", "98765-43210; 99887 76655", "n/a", "", None,
+    "\u096f\u096e\u096d\u096c\u096b\u096a\u0969\u0968\u0967\u0966",
+]
+EMAILS = ["hr@acme.in", " jobs@beta.com ; hr@beta.com", "not-an-email", "", None]
+URLS = ["https://in.linkedin.com/jobs/view/1", "http://naukri.com/x", "ftp://x", "", None]
+
+
+def build_columns(n: int) -> dict:
+    rnd = random.Random(7)
+    return (
+        {
+            "date_posted": [rnd.choice(AGES) for _ in range(n)],
+            "job_location": [rnd.choice(LOCATIONS) for _ in range(n)],
+            "contact_phone": [rnd.choice(PHONES) for _ in range(n)],
+            "contact_email": [rnd.choice(EMAILS) for _ in range(n)],
+            "job_url": [rnd.choice(URLS) for _ in range(n)],
+        }
+    )
+
+
+def per_row_links(cols: dict) -> pd.DataFrame:
+    """Mirror of the per-cell rules apply_excel_hyperlinks used before vectorization."""
+    url_links, email_links, phone_links = [], [], []
+    for url, email, phone in zip(cols["job_url"], cols["contact_email"], cols["contact_phone"]):
+        url_links.append(url if url and isinstance(url, str) and url.startswith("http") else None)
+        first_email = email.strip().split(";")[0].strip() if email and isinstance(email, str) else ""
+        email_links.append(f"mailto:{first_email}" if "@" in first_email else None)
+        tel = ls.normalize_tel(phone.strip().split(";")[0].strip()) if phone and isinstance(phone, str) else None
+        phone_links.append(f"tel:{tel}" if tel else None)
+    return pd.DataFrame(
+        {"job_url": url_links, "contact_email": email_links, "contact_phone": phone_links}, dtype=object
+    )
+
+
+def timed(label: str, fn):
+    started = time.perf_counter()
+    result = fn()
+    print(f"{label:<28} {time.perf_counter() - started:8.3f}s")
+    return result
+
+
+def main() -> None:
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 100_000
+    cols = build_columns(n)
+    df = pd.DataFrame(cols, dtype=object)
+    print(f"rows: {n}")
+
+    row_age = timed("parse_age_days (rows)", lambda: [ls.parse_age_days(v) for v in cols["date_posted"]])
+    vec_age = timed("parse_age_days_vec", lambda: ls.parse_age_days_vec(df["date_posted"]))
+    assert pd.Series(row_age, dtype=float).equals(vec_age.astype(float)), "age mismatch"
+
+    row_loc = timed("location_matches (rows)", lambda: [ls.location_matches(v) for v in cols["job_location"]])
+    vec_loc = timed("location_matches_vec", lambda: ls.location_matches_vec(df["job_location"]))
+    assert row_loc == vec_loc.tolist(), "location mismatch"
+
+    row_tel = timed("normalize_tel (rows)", lambda: [ls.normalize_tel(v) for v in cols["contact_phone"]])
+    vec_tel = timed("normalize_tel_vec", lambda: ls.normalize_tel_vec(df["contact_phone"]))
+    assert row_tel == vec_tel.tolist(), "phone mismatch"
+
+    row_links = timed("hyperlink targets (rows)", lambda: per_row_links(cols))
+    vec_links = timed("hyperlink_targets", lambda: ls.hyperlink_targets(df))
+    for col in row_links.columns:
+        assert row_links[col].tolist() == vec_links[col].tolist(), f"{col} link mismatch"
+
+    print("vectorized output matches per-row output")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from typing import Dict, Iterator, List, Optional
+
+# posted_at is left out on purpose: "2 days ago" drifts between runs without the posting changing.
+FINGERPRINT_FIELDS = ("title", "company", "location", "platform", "summary")
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS postings (
+    job_key TEXT PRIMARY KEY,
+    fingerprint TEXT NOT NULL,
+    row TEXT NOT NULL,
+    last_run INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS postings_last_run ON postings (last_run);
+"""
+
+
+def _normalize(value) -> str:
+    return re.sub(r"\s+", " ", str(value or "")).strip().lower()
+
+
+def job_key(row: Dict[str, str]) -> str:
+    url = (row.get("url") or "").split("?")[0].split("#")[0].rstrip("/").lower()
+    if url:
+        return url
+    return f"{_normalize(row.get('title'))}|{_normalize(row.get('company'))}"
+
+
+def fingerprint(row: Dict[str, str]) -> str:
+    payload = "\x1f".join(_normalize(row.get(field)) for field in FINGERPRINT_FIELDS)
+    return hashlib.sha1(payload.encode("utf-8")).hexdigest()
+
+
+def search_state_path(state_dir: str, roles: List[str], locations: List[str], platforms: List[str]) -> str:
+    """One state file per distinct search, so unrelated searches never diff against each other."""
+    signature = json.dumps(
+        [sorted(_normalize(r) for r in roles), sorted(_normalize(l) for l in locations), sorted(platforms)]
+    )
+    digest = hashlib.sha1(signature.encode("utf-8")).hexdigest()[:16]
+    return os.path.join(state_dir, f"search_{digest}.sqlite3")
+
+
+class DeltaTracker:
+    """Streaming change detection against the previous runs of one search.
+
+    Fingerprints live in SQLite rather than memory, so rows can be passed
+    through ``observe`` one at a time no matter how large the run is.
+    Postings missing from an incomplete run are carried forward instead of
+    being reported as disappeared.
+    """
+
+    def __init__(self, path: str, complete_run: bool = True) -> None:
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        self.complete_run = complete_run
+        self.conn = sqlite3.connect(path)
+        self.conn.executescript(SCHEMA)
+        self.run = self.conn.execute("SELECT COALESCE(MAX(last_run), 0) + 1 FROM postings").fetchone()[0]
+        self.counts = {"new": 0, "changed": 0, "disappeared": 0}
+
+    def observe(self, row: Dict[str, str]) -> Optional[str]:
+        """Record a posting from this run; returns "new", "changed" or None."""
+        key = job_key(row)
+        fp = fingerprint(row)
+        before = self.conn.execute("SELECT fingerprint FROM postings WHERE job_key = ?", (key,)).fetchone()
+        self.conn.execute(
+            "INSERT OR REPLACE INTO postings (job_key, fingerprint, row, last_run) VALUES (?, ?, ?, ?)",
+            (key, fp, json.dumps(row, ensure_ascii=False), self.run),
+        )
+        if before is None:
+            change = "new"
+        elif before[0] != fp:
+            change = "changed"
+        else:
+            return None
+        self.counts[change] += 1
+        return change
+
+    def finish(self) -> Iterator[Dict[str, str]]:
+        """Yield postings that disappeared (complete runs only) and commit the new state."""
+        if self.complete_run:
+            gone = self.conn.execute("SELECT row FROM postings WHERE last_run < ?", (self.run,))
+            for (row,) in gone:
+                self.counts["disappeared"] += 1
+                yield {**json.loads(row), "change": "disappeared"}
+            self.conn.execute("DELETE FROM postings WHERE last_run < ?", (self.run,))
+        self.conn.commit()
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,313 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import hashlib
+import json
+import os
+import re
+import sqlite3
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
+
+from linkedin_scraper import _parse_age_days
+
+# Scraper outputs use two schemas: backend rows and the root JobRecord columns.
+FIELD_ALIASES = {
+    "title": ("title", "job_title"),
+    "company": ("company", "company_name"),
+    "location": ("location", "job_location"),
+    "summary": ("summary", "job_description_summary"),
+    "platform": ("platform", "portal"),
+    "url": ("url", "job_url"),
+    "posted_at": ("posted_at", "date_posted"),
+}
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS jobs (
+    id INTEGER PRIMARY KEY,
+    job_key TEXT NOT NULL UNIQUE,
+    title TEXT,
+    company TEXT,
+    location TEXT,
+    summary TEXT,
+    platform TEXT,
+    url TEXT,
+    posted_at TEXT,
+    posted_date TEXT,
+    first_seen TEXT,
+    last_seen TEXT
+);
+CREATE INDEX IF NOT EXISTS jobs_platform ON jobs (platform);
+CREATE INDEX IF NOT EXISTS jobs_posted_date ON jobs (posted_date);
+CREATE VIRTUAL TABLE IF NOT EXISTS jobs_fts USING fts5 (
+    title, company, location, summary, tokenize = 'unicode61'
+);
+CREATE TABLE IF NOT EXISTS sources (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime REAL NOT NULL,
+    offset INTEGER NOT NULL,
+    identity TEXT
+);
+"""
+
+
+def _field(row: Dict, name: str) -> str:
+    for alias in FIELD_ALIASES[name]:
+        value = row.get(alias)
+        if value:
+            return str(value).strip()
+    return ""
+
+
+def _posted_date(posted_at: str, seen_at: dt.datetime) -> Optional[str]:
+    """Turn a relative label ("3 days ago") or ISO date into a YYYY-MM-DD date."""
+    if not posted_at:
+        return None
+    m = re.match(r"\d{4}-\d{2}-\d{2}", posted_at)
+    if m:
+        return m.group(0)
+    days = _parse_age_days(posted_at)
+    if days is None:
+        return None
+    return (seen_at - dt.timedelta(days=days)).date().isoformat()
+
+
+def _file_identity(path: str) -> str:
+    """Inode plus a hash of the first line: survives appends, changes when the file is recreated."""
+    with open(path, "rb") as fh:
+        first_line = fh.readline()
+    return f"{os.stat(path).st_ino}:{hashlib.sha1(first_line).hexdigest()}"
+
+
+def _parse_timestamp(value: Optional[str], default: dt.datetime) -> dt.datetime:
+    if not value:
+        return default
+    try:
+        return dt.datetime.fromisoformat(str(value))
+    except ValueError:
+        return default
+
+
+class JobIndex:
+    """SQLite FTS5 index over accumulated scraper output (journals and xlsx files)."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.executescript(SCHEMA)
+        columns = {row["name"] for row in self.conn.execute("PRAGMA table_info(sources)")}
+        if "identity" not in columns:
+            self.conn.execute("ALTER TABLE sources ADD COLUMN identity TEXT")
+
+    def close(self) -> None:
+        self.conn.close()
+
+    def __enter__(self) -> "JobIndex":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def upsert(self, rows: Iterable[Tuple[Dict, dt.datetime]]) -> int:
+        count = 0
+        with self.conn:
+            for row, seen_at in rows:
+                record = {name: _field(row, name) for name in FIELD_ALIASES}
+                if not record["title"]:
+                    continue
+                job_key = record["url"] or f"{record['title'].lower()}|{record['company'].lower()}"
+                seen = seen_at.isoformat()
+                existing = self.conn.execute("SELECT id FROM jobs WHERE job_key = ?", (job_key,)).fetchone()
+                values = (
+                    record["title"],
+                    record["company"],
+                    record["location"],
+                    record["summary"],
+                    record["platform"],
+                    record["url"],
+                    record["posted_at"],
+                    _posted_date(record["posted_at"], seen_at),
+                )
+                if existing:
+                    job_id = existing["id"]
+                    self.conn.execute(
+                        "UPDATE jobs SET title = ?, company = ?, location = ?, summary = ?, platform = ?,"
+                        " url = ?, posted_at = ?, posted_date = COALESCE(posted_date, ?), last_seen = ?"
+                        " WHERE id = ?",
+                        values + (seen, job_id),
+                    )
+                    self.conn.execute("DELETE FROM jobs_fts WHERE rowid = ?", (job_id,))
+                else:
+                    job_id = self.conn.execute(
+                        "INSERT INTO jobs (job_key, title, company, location, summary, platform, url,"
+                        " posted_at, posted_date, first_seen, last_seen)"
+                        " VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                        (job_key,) + values + (seen, seen),
+                    ).lastrowid
+                self.conn.execute(
+                    "INSERT INTO jobs_fts (rowid, title, company, location, summary) VALUES (?, ?, ?, ?, ?)",
+                    (job_id, record["title"], record["company"], record["location"], record["summary"]),
+                )
+                count += 1
+        return count
+
+    def _source_state(self, path: str) -> Optional[sqlite3.Row]:
+        return self.conn.execute(
+            "SELECT size, mtime, offset, identity FROM sources WHERE path = ?", (path,)
+        ).fetchone()
+
+    def _save_source_state(self, path: str, offset: int, identity: Optional[str] = None) -> None:
+        stat = os.stat(path)
+        with self.conn:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO sources (path, size, mtime, offset, identity) VALUES (?, ?, ?, ?, ?)",
+                (path, stat.st_size, stat.st_mtime, offset, identity),
+            )
+
+    def add_journal(self, path: str) -> int:
+        """Index journal entries appended since the last call for this file.
+
+        A journal recreated at the same path (a run without --resume) has a
+        different identity and is read again from the start.
+        """
+        path = os.path.abspath(path)
+        if not os.path.exists(path):
+            # RunJournal only creates the file once a unit is recorded.
+            return 0
+        state = self._source_state(path)
+        identity = _file_identity(path)
+        offset = 0
+        if state and state["identity"] == identity and state["offset"] <= os.path.getsize(path):
+            offset = state["offset"]
+        file_mtime = dt.datetime.fromtimestamp(os.path.getmtime(path), dt.timezone.utc)
+
+        def rows() -> Iterator[Tuple[Dict, dt.datetime]]:
+            nonlocal offset
+            with open(path, "rb") as fh:
+                fh.seek(offset)
+                for line in fh:
+                    if not line.endswith(b"\n"):
+                        break
+                    offset += len(line)
+                    try:
+                        entry = json.loads(line)
+                    except ValueError:
+                        continue
+                    seen_at = _parse_timestamp(entry.get("completed_at"), file_mtime)
+                    for row in entry.get("rows") or []:
+                        yield row, seen_at
+
+        count = self.upsert(rows())
+        self._save_source_state(path, offset, identity)
+        return count
+
+    def add_xlsx(self, path: str) -> int:
+        """Index an exported workbook unless it is unchanged since it was last indexed."""
+        from openpyxl import load_workbook
+
+        path = os.path.abspath(path)
+        stat = os.stat(path)
+        state = self._source_state(path)
+        if state and state["size"] == stat.st_size and state["mtime"] == stat.st_mtime:
+            return 0
+        file_mtime = dt.datetime.fromtimestamp(stat.st_mtime, dt.timezone.utc)
+
+        wb = load_workbook(path, read_only=True)
+        try:
+            values = wb.worksheets[0].iter_rows(values_only=True)
+            headers = [str(h or "") for h in next(values, [])]
+            parsed = []
+            for values_row in values:
+                row = dict(zip(headers, values_row))
+                parsed.append((row, _parse_timestamp(row.get("fetched_at_utc"), file_mtime)))
+        finally:
+            wb.close()
+
+        count = self.upsert(parsed)
+        self._save_source_state(path, stat.st_size)
+        return count
+
+    def add_path(self, path: str) -> int:
+        if path.endswith(".jsonl"):
+            return self.add_journal(path)
+        if path.endswith(".xlsx"):
+            return self.add_xlsx(path)
+        return 0
+
+    def search(
+        self,
+        text: str = "",
+        portals: Optional[List[str]] = None,
+        posted_after: Optional[str] = None,
+        posted_before: Optional[str] = None,
+        page: int = 1,
+        per_page: int = 20,
+    ) -> Dict:
+        """Ranked, paginated search; returns {"total", "page", "per_page", "results"}."""
+        where: List[str] = []
+        params: List = []
+        tokens = re.findall(r"\w+", text.lower())
+        if tokens:
+            where.append("jobs_fts MATCH ?")
+            params.append(" ".join(f'"{tok}"*' for tok in tokens))
+        if portals:
+            where.append(f"LOWER(jobs.platform) IN ({', '.join('?' for _ in portals)})")
+            params.extend(p.lower() for p in portals)
+        if posted_after:
+            where.append("jobs.posted_date >= ?")
+            params.append(posted_after)
+        if posted_before:
+            where.append("jobs.posted_date <= ?")
+            params.append(posted_before)
+
+        source = "jobs JOIN jobs_fts ON jobs_fts.rowid = jobs.id" if tokens else "jobs"
+        clause = f" WHERE {' AND '.join(where)}" if where else ""
+        order = "bm25(jobs_fts, 4.0, 2.0, 2.0, 1.0), jobs.posted_date DESC" if tokens else "jobs.posted_date DESC"
+        page = max(1, page)
+
+        total = self.conn.execute(f"SELECT COUNT(*) FROM {source}{clause}", params).fetchone()[0]
+        rows = self.conn.execute(
+            f"SELECT jobs.* FROM {source}{clause} ORDER BY {order}, jobs.id DESC LIMIT ? OFFSET ?",
+            params + [per_page, (page - 1) * per_page],
+        ).fetchall()
+        return {
+            "total": total,
+            "page": page,
+            "per_page": per_page,
+            "results": [{k: row[k] for k in row.keys() if k not in ("id", "job_key")} for row in rows],
+        }
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Index and search accumulated scraper output.")
+    parser.add_argument("--db", default="jobs_index.sqlite3", help="Index database path")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    index_cmd = sub.add_parser("index", help="Add journals (.jsonl) or workbooks (.xlsx) to the index")
+    index_cmd.add_argument("paths", nargs="+")
+
+    search_cmd = sub.add_parser("search", help="Search indexed jobs")
+    search_cmd.add_argument("text", nargs="?", default="")
+    search_cmd.add_argument("--portal", action="append", help="Restrict to a portal (repeatable)")
+    search_cmd.add_argument("--since", help="Posted on or after YYYY-MM-DD")
+    search_cmd.add_argument("--until", help="Posted on or before YYYY-MM-DD")
+    search_cmd.add_argument("--page", type=int, default=1)
+    search_cmd.add_argument("--per-page", type=int, default=20)
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    with JobIndex(args.db) as index:
+        if args.command == "index":
+            for path in args.paths:
+                print(f"[info] Indexed {index.add_path(path)} rows from {path}")
+            return
+        result = index.search(args.text, args.portal, args.since, args.until, args.page, args.per_page)
+        print(json.dumps(result, ensure_ascii=False, indent=2))
+
+
+if __name__ == "__main__":
+    main()
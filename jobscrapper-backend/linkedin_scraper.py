@@ -1,26 +1,74 @@
 from __future__ import annotations
 
 import datetime as dt
+import hashlib
 import os
 import re
 import time
+from collections import OrderedDict
 from html import unescape
-from typing import Dict, List, Optional
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple
 from urllib.parse import quote_plus, unquote, urlparse
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 
+from job_delta import DeltaTracker
+from page_archive import PageArchive
+from run_journal import RunJournal
 
 # Runtime-overridable settings (updated by wrapper)
 OUTPUT_FILE = "jobs_output.xlsx"
 MAX_JOB_AGE_DAYS = 5
 HR_KEYWORDS = ["Software Engineer"]
 LOCATION_QUERIES = ["India"]
+# Completed query units are journaled here; empty means a per-output file under
+# STATE_DIR, which is removed again once every unit has completed.
+JOURNAL_FILE = ""
+# Private working files (journals); keep this out of any publicly served directory.
+STATE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".state")
+RESUME = False
+# Previous-run fingerprints for the delta feed; empty disables change detection.
+DELTA_STATE_FILE = ""
+# Search index updated with this run's rows (see job_index.py); empty disables it.
+INDEX_DB = ""
+# Raw LinkedIn/Yahoo pages are archived here for offline re-parsing; empty disables it.
+ARCHIVE_DIR = ""
+# Wall-clock budget for the whole run in seconds; 0 disables the deadline.
+DEADLINE_SECONDS = 0
+# Time kept back at the end of a deadline run for writing the output.
+DEADLINE_RESERVE_SECONDS = 15
 
 HEADLESS = True
 WAIT_SECONDS = 12
 SEARCH_PAGES = 1
 MAX_RESULTS_PER_QUERY = 20
+# Roles that stand in for several merged roles (see query_planner.plan_queries)
+# get this many times MAX_RESULTS_PER_QUERY.
+ROLE_QUERY_WEIGHTS: Dict[str, int] = {}
+# Dedupe remembers this many recent job keys; older ones are forgotten to keep memory flat.
+DEDUPE_WINDOW = 200_000
+# Excel's per-worksheet hyperlink limit; openpyxl also holds every link in memory until save.
+MAX_HYPERLINKS_PER_SHEET = 65_530
+# LinkedIn searches run in this many tabs of one browser; 1 keeps one browser per search.
+LINKEDIN_TABS = 4
+LINKEDIN_SETTLE_SECONDS = 1.5
+LINKEDIN_POLL_SECONDS = 0.25
+
+# Yahoo site-search batching: roles/portals OR-combined into one SERP query.
+# Opt-in: a batched query shares one page of hits between all of its roles and
+# portals, trading per-role recall for fewer requests. 1 searches each alone.
+YAHOO_ROLE_BATCH_SIZE = 1
+YAHOO_PORTAL_BATCH_SIZE = 1
+YAHOO_PORTALS = ("Naukri", "Indeed", "Foundit", "Glassdoor")
+YAHOO_DOMAINS = {
+    "Indeed": "indeed.com",
+    "Naukri": "naukri.com",
+    "Foundit": "foundit.in",
+    "Glassdoor": "glassdoor.com",
+}
+# Lower runs first, so a deadline cuts the least productive portals.
+PORTAL_PRIORITY = {"LinkedIn": 0, "Naukri": 1, "Indeed": 2, "Glassdoor": 3, "Foundit": 4}
 
 USER_AGENT = (
     "Mozilla/5.0 (Windows NT 10.0; Win64; x64) "
@@ -29,6 +77,76 @@ USER_AGENT = (
 )
 
 
+_archive: Optional[PageArchive] = None
+_deadline_at: Optional[float] = None
+_deadline_cut = False
+_run_id: Optional[str] = None
+
+
+def _start_deadline() -> None:
+    global _deadline_at
+    _deadline_at = time.monotonic() + DEADLINE_SECONDS if DEADLINE_SECONDS > 0 else None
+
+
+def _time_left() -> Optional[float]:
+    if _deadline_at is None:
+        return None
+    return _deadline_at - time.monotonic() - DEADLINE_RESERVE_SECONDS
+
+
+def _deadline_reached() -> bool:
+    left = _time_left()
+    return left is not None and left <= 0
+
+
+def _stop_for_deadline() -> bool:
+    """Checked before each fetch; remembers that the current unit was cut short."""
+    global _deadline_cut
+    if _deadline_reached():
+        _deadline_cut = True
+        return True
+    return False
+
+
+def _bounded_timeout(seconds: float) -> float:
+    left = _time_left()
+    if left is None:
+        return seconds
+    return max(1.0, min(seconds, left))
+
+
+def _note_timeout(seconds: float) -> None:
+    """Called when a fetch given _bounded_timeout(seconds) times out.
+
+    If the deadline had shortened that timeout, the fetch was cut off rather
+    than slow, so the current unit is marked as cut short.
+    """
+    global _deadline_cut
+    if _bounded_timeout(seconds) < seconds:
+        _deadline_cut = True
+
+
+def _archive_page(kind: str, url: str, html: str, meta: Dict) -> None:
+    global _archive
+    if not ARCHIVE_DIR:
+        return
+    if _archive is None or _archive.root != ARCHIVE_DIR:
+        _archive = PageArchive(ARCHIVE_DIR)
+    # The filters the page was parsed under, so a reparse reproduces this run's rows.
+    roles = meta.get("roles") or [meta.get("role", "")]
+    settings = {
+        "run": _run_id,
+        "max_days": MAX_JOB_AGE_DAYS,
+        "max_results": MAX_RESULTS_PER_QUERY,
+        "role_weights": {role: ROLE_QUERY_WEIGHTS[role] for role in roles if role in ROLE_QUERY_WEIGHTS},
+    }
+    _archive.put(kind, url, html, {**meta, **settings})
+
+
+def _result_cap(role_query: str) -> int:
+    return MAX_RESULTS_PER_QUERY * ROLE_QUERY_WEIGHTS.get(role_query, 1)
+
+
 def _clean_text(value: str) -> str:
     text = unescape(value or "")
     text = re.sub(r"<[^>]+>", " ", text)
@@ -139,8 +257,10 @@ def _require_scraper_deps():
     }
 
 
-def _build_driver(deps):
+def _build_driver(deps, page_load_strategy: Optional[str] = None):
     options = deps["Options"]()
+    if page_load_strategy:
+        options.page_load_strategy = page_load_strategy
     if HEADLESS:
         options.add_argument("--headless=new")
     options.add_argument("--no-sandbox")
@@ -162,228 +282,513 @@ def _build_driver(deps):
     return deps["webdriver"].Chrome(service=service, options=options)
 
 
+def _linkedin_search_url(role_query: str, location_query: str, page: int) -> str:
+    return (
+        "https://www.linkedin.com/jobs/search/"
+        f"?keywords={quote_plus(role_query or 'jobs')}&location={quote_plus(location_query or 'India')}"
+        f"&f_TPR=r{MAX_JOB_AGE_DAYS * 86400}&start={page * 25}"
+    )
+
+
+def _parse_linkedin_cards(deps, page_source: str, role_query: str, location_query: str) -> List[Dict[str, str]]:
+    soup = deps["BeautifulSoup"](page_source, "html.parser")
+    rows: List[Dict[str, str]] = []
+
+    for card in soup.select("li"):
+        a = card.select_one("a.base-card__full-link[href]")
+        if not a:
+            continue
+
+        title = _clean_text(a.get_text(" ", strip=True))
+        if not title:
+            continue
+
+        company = ""
+        for sel in ("h4.base-search-card__subtitle", "a.hidden-nested-link"):
+            n = card.select_one(sel)
+            if n and n.get_text(strip=True):
+                company = _clean_text(n.get_text(" ", strip=True))
+                break
+
+        location_text = ""
+        n = card.select_one("span.job-search-card__location")
+        if n and n.get_text(strip=True):
+            location_text = _clean_text(n.get_text(" ", strip=True))
+
+        posted_at = ""
+        for sel in ("time", "span.job-search-card__listdate", "span.job-search-card__listdate--new"):
+            n = card.select_one(sel)
+            if n and n.get_text(strip=True):
+                posted_at = _clean_text(n.get_text(" ", strip=True))
+                break
+
+        job_url = (a.get("href", "") or "").split("?")[0].strip()
+
+        if not _matches_filters(title, location_text, role_query, location_query):
+            continue
+        if not _within_age_limit(posted_at, MAX_JOB_AGE_DAYS):
+            continue
+
+        rows.append(
+            {
+                "title": title,
+                "company": company,
+                "location": location_text,
+                "platform": "LinkedIn",
+                "source": "LinkedIn",
+                "url": job_url,
+                "posted_at": posted_at,
+            }
+        )
+
+    return rows
+
+
 def scrape_linkedin_last24h(role_query: str = "", location_query: str = "") -> List[Dict[str, str]]:
     deps = _require_scraper_deps()
     rows: List[Dict[str, str]] = []
+    if _stop_for_deadline():
+        return rows
 
     driver = _build_driver(deps)
     try:
-        query = role_query or "jobs"
-        location = location_query or "India"
-
         for page in range(SEARCH_PAGES):
-            start = page * 25
-            url = (
-                "https://www.linkedin.com/jobs/search/"
-                f"?keywords={quote_plus(query)}&location={quote_plus(location)}"
-                f"&f_TPR=r{MAX_JOB_AGE_DAYS * 86400}&start={start}"
-            )
+            if _stop_for_deadline():
+                break
             try:
-                driver.get(url)
-                deps["WebDriverWait"](driver, WAIT_SECONDS).until(
+                driver.set_page_load_timeout(_bounded_timeout(60))
+                driver.get(_linkedin_search_url(role_query, location_query, page))
+                deps["WebDriverWait"](driver, _bounded_timeout(WAIT_SECONDS)).until(
                     deps["EC"].presence_of_element_located((deps["By"].CSS_SELECTOR, "a.base-card__full-link"))
                 )
                 time.sleep(1.5)
             except (deps["TimeoutException"], deps["WebDriverException"]):
+                _note_timeout(60)
                 continue
 
-            soup = deps["BeautifulSoup"](driver.page_source, "html.parser")
-            cards = soup.select("li")
-
-            for card in cards:
-                a = card.select_one("a.base-card__full-link[href]")
-                if not a:
-                    continue
+            page_source = driver.page_source
+            _archive_page(
+                "linkedin",
+                driver.current_url,
+                page_source,
+                {"role": role_query, "location": location_query, "page": page},
+            )
+            parsed = _parse_linkedin_cards(deps, page_source, role_query, location_query)
+            rows.extend(parsed[: _result_cap(role_query) - len(rows)])
+            if len(rows) >= _result_cap(role_query):
+                break
+    finally:
+        driver.quit()
 
-                title = _clean_text(a.get_text(" ", strip=True))
-                if not title:
-                    continue
+    return rows
 
-                company = ""
-                for sel in ("h4.base-search-card__subtitle", "a.hidden-nested-link"):
-                    n = card.select_one(sel)
-                    if n and n.get_text(strip=True):
-                        company = _clean_text(n.get_text(" ", strip=True))
-                        break
 
-                location_text = ""
-                n = card.select_one("span.job-search-card__location")
-                if n and n.get_text(strip=True):
-                    location_text = _clean_text(n.get_text(" ", strip=True))
+def scrape_linkedin_tabs(queries: List[Tuple[str, str]]) -> Dict[Tuple[str, str], List[Dict[str, str]]]:
+    """Run several LinkedIn searches at once in tabs of a single browser.
 
-                posted_at = ""
-                for sel in ("time", "span.job-search-card__listdate", "span.job-search-card__listdate--new"):
-                    n = card.select_one(sel)
-                    if n and n.get_text(strip=True):
-                        posted_at = _clean_text(n.get_text(" ", strip=True))
-                        break
+    Each (role, location, page) search gets its own tab, up to LINKEDIN_TABS
+    open at a time. Tabs are polled round-robin; a tab is parsed once its job
+    cards have been present for LINKEDIN_SETTLE_SECONDS, then closed.
+    """
+    deps = _require_scraper_deps()
+    by = deps["By"]
+    results: Dict[Tuple[str, str], List[Dict[str, str]]] = {q: [] for q in queries}
+    pending = [(query, page) for page in range(SEARCH_PAGES) for query in queries]
+    if not pending or _stop_for_deadline():
+        return results
 
-                job_url = (a.get("href", "") or "").split("?")[0].strip()
+    driver = _build_driver(deps, page_load_strategy="none")
+    try:
+        home = driver.current_window_handle
+        active: Dict[str, list] = {}  # handle -> [query, started_at, ready_at, page]
 
-                if not _matches_filters(title, location_text, role_query, location_query):
-                    continue
-                if not _within_age_limit(posted_at, MAX_JOB_AGE_DAYS):
+        def close_tab(handle: str) -> None:
+            active.pop(handle, None)
+            try:
+                driver.switch_to.window(handle)
+                driver.close()
+            except deps["WebDriverException"]:
+                pass
+            driver.switch_to.window(home)
+
+        while True:
+            while pending and len(active) < LINKEDIN_TABS and not _stop_for_deadline():
+                query, page = pending.pop(0)
+                if len(results[query]) >= _result_cap(query[0]):
                     continue
+                driver.switch_to.window(home)
+                driver.switch_to.new_window("tab")
+                handle = driver.current_window_handle
+                active[handle] = [query, time.monotonic(), None, page]
+                try:
+                    driver.get(_linkedin_search_url(query[0], query[1], page))
+                except deps["WebDriverException"]:
+                    close_tab(handle)
+            if not active:
+                break
 
-                rows.append(
-                    {
-                        "title": title,
-                        "company": company,
-                        "location": location_text,
-                        "platform": "LinkedIn",
-                        "source": "LinkedIn",
-                        "url": job_url,
-                        "posted_at": posted_at,
-                    }
-                )
-
-                if len(rows) >= MAX_RESULTS_PER_QUERY:
-                    break
+            for handle, state in list(active.items()):
+                query, started_at, ready_at, page = state
+                now = time.monotonic()
+                try:
+                    driver.switch_to.window(handle)
+                    if ready_at is None:
+                        if driver.find_elements(by.CSS_SELECTOR, "a.base-card__full-link"):
+                            state[2] = now
+                        elif now - started_at > _bounded_timeout(WAIT_SECONDS):
+                            _note_timeout(WAIT_SECONDS)
+                            close_tab(handle)
+                        continue
+                    if now - ready_at < LINKEDIN_SETTLE_SECONDS:
+                        continue
+                    page_source = driver.page_source
+                    _archive_page(
+                        "linkedin",
+                        driver.current_url,
+                        page_source,
+                        {"role": query[0], "location": query[1], "page": page},
+                    )
+                    parsed = _parse_linkedin_cards(deps, page_source, query[0], query[1])
+                except deps["WebDriverException"]:
+                    close_tab(handle)
+                    continue
+                results[query].extend(parsed[: _result_cap(query[0]) - len(results[query])])
+                close_tab(handle)
 
-            if len(rows) >= MAX_RESULTS_PER_QUERY:
-                break
+            time.sleep(LINKEDIN_POLL_SECONDS)
     finally:
         driver.quit()
 
-    return rows
+    return results
 
 
-def yahoo_site_results_last5d(portal_name: str, role_query: str = "", location_query: str = "") -> List[Dict[str, str]]:
-    deps = _require_scraper_deps()
-    requests = deps["requests"]
-    BeautifulSoup = deps["BeautifulSoup"]
+def _chunks(items, size: int) -> List[list]:
+    items = list(items)
+    size = max(1, size)
+    return [items[i : i + size] for i in range(0, len(items), size)]
 
-    domain_map = {
-        "Indeed": "indeed.com",
-        "Naukri": "naukri.com",
-        "Foundit": "foundit.in",
-        "Glassdoor": "glassdoor.com",
-    }
-    site_query = domain_map.get(portal_name)
-    if not site_query:
-        return []
 
-    query_parts = [f"site:{site_query}"]
-    if role_query.strip():
-        query_parts.append(f'"{role_query.strip()}"')
-    if location_query.strip():
-        query_parts.append(location_query.strip())
-    query_parts.append("jobs")
-    query_parts.append("last 5 days")
-    query = " ".join(query_parts)
+def _parse_yahoo_results(deps, html: str) -> List[Tuple[str, str, str]]:
+    """Return (title, real_url, snippet) for each organic result on a Yahoo SERP."""
+    soup = deps["BeautifulSoup"](html, "html.parser")
+    hits: List[Tuple[str, str, str]] = []
+    for block in soup.select("div#web ol li"):
+        a = block.select_one("div.compTitle h3 a[href]")
+        if not a:
+            continue
+        title = _clean_text(a.get_text(" ", strip=True))
+        real_url = _decode_yahoo_redirect(a.get("href", "").strip())
+        snippet_node = block.select_one("div.compText")
+        snippet = _clean_text(snippet_node.get_text(" ", strip=True) if snippet_node else "")
+        hits.append((title, real_url, snippet))
+    return hits
+
 
+def _yahoo_search(query: str, context: Optional[Dict] = None):
+    """Yield (title, real_url, snippet) for each organic Yahoo result of a query."""
+    deps = _require_scraper_deps()
+    requests = deps["requests"]
     headers = {"User-Agent": USER_AGENT}
-    rows: List[Dict[str, str]] = []
 
     for page in range(SEARCH_PAGES):
+        if _stop_for_deadline():
+            break
         start = page * 10 + 1
         url = f"https://search.yahoo.com/search?p={quote_plus(query)}&b={start}"
         try:
-            resp = requests.get(url, headers=headers, timeout=20)
+            resp = requests.get(url, headers=headers, timeout=_bounded_timeout(20))
             if resp.status_code >= 400:
                 continue
-            soup = BeautifulSoup(resp.text, "html.parser")
         except requests.RequestException:
+            _note_timeout(20)
             continue
 
-        blocks = soup.select("div#web ol li")
-        for block in blocks:
-            a = block.select_one("div.compTitle h3 a[href]")
-            if not a:
-                continue
+        _archive_page("yahoo", url, resp.text, {"query": query, "page": page, **(context or {})})
+        yield from _parse_yahoo_results(deps, resp.text)
 
-            title = _clean_text(a.get_text(" ", strip=True))
-            raw_url = a.get("href", "").strip()
-            real_url = _decode_yahoo_redirect(raw_url)
-            netloc = urlparse(real_url).netloc.lower()
-            if site_query not in netloc:
-                continue
-            if not _looks_like_listing_url(real_url, portal_name):
-                continue
 
-            snippet_node = block.select_one("div.compText")
-            snippet = _clean_text(snippet_node.get_text(" ", strip=True) if snippet_node else "")
+def _yahoo_posted_at(snippet: str) -> str:
+    m = re.search(
+        r"(\d+\s+(?:hour|hours|day|days)\s+ago|Today|Just posted|last 5 days|within 5 days)",
+        snippet,
+        flags=re.IGNORECASE,
+    )
+    if m:
+        return _clean_text(m.group(1))
+    return "Within 5 days"
 
-            posted_at = "Within 5 days"
-            m = re.search(
-                r"(\d+\s+(?:hour|hours|day|days)\s+ago|Today|Just posted|last 5 days|within 5 days)",
-                snippet,
-                flags=re.IGNORECASE,
-            )
-            if m:
-                posted_at = _clean_text(m.group(1))
 
-            location_hint = f"{location_query} {snippet}"
-            if not _matches_filters(title, location_hint, role_query, location_query):
-                continue
-            if not _within_age_limit(posted_at, MAX_JOB_AGE_DAYS):
-                continue
+def _yahoo_row(portal_name: str, title: str, url: str, location_query: str, posted_at: str) -> Dict[str, str]:
+    return {
+        "title": title,
+        "company": "",
+        "location": _clean_text(location_query),
+        "platform": portal_name,
+        "source": portal_name,
+        "url": url,
+        "posted_at": posted_at,
+    }
 
-            rows.append(
-                {
-                    "title": title,
-                    "company": "",
-                    "location": _clean_text(location_query),
-                    "platform": portal_name,
-                    "source": portal_name,
-                    "url": real_url,
-                    "posted_at": posted_at,
-                }
-            )
 
-            if len(rows) >= MAX_RESULTS_PER_QUERY:
-                break
+def _assign_yahoo_hits(
+    hits, portal_names: List[str], role_queries: List[str], location_query: str
+) -> Dict[str, List[Dict[str, str]]]:
+    """Filter Yahoo hits and assign each to every role whose filters it passes.
 
-        if len(rows) >= MAX_RESULTS_PER_QUERY:
+    Stops consuming ``hits`` once every role is full, so a lazy search
+    generator does not fetch pages nobody needs.
+    """
+    results: Dict[str, List[Dict[str, str]]] = {role: [] for role in role_queries}
+    for title, real_url, snippet in hits:
+        netloc = urlparse(real_url).netloc.lower()
+        portal_name = next((p for p in portal_names if YAHOO_DOMAINS[p] in netloc), None)
+        if not portal_name:
+            continue
+        if not _looks_like_listing_url(real_url, portal_name):
+            continue
+
+        posted_at = _yahoo_posted_at(snippet)
+        if not _within_age_limit(posted_at, MAX_JOB_AGE_DAYS):
+            continue
+
+        location_hint = f"{location_query} {snippet}"
+        for role in role_queries:
+            if len(results[role]) >= _result_cap(role):
+                continue
+            if _matches_filters(title, location_hint, role, location_query):
+                results[role].append(_yahoo_row(portal_name, title, real_url, location_query, posted_at))
+
+        if all(len(rows) >= _result_cap(role) for role, rows in results.items()):
             break
 
-    return rows
+    return results
 
 
-def _dedupe(rows: List[Dict[str, str]]) -> List[Dict[str, str]]:
-    unique = {}
-    for row in rows:
-        key = (row.get("title", "").lower(), row.get("company", "").lower(), row.get("url", ""))
-        unique[key] = row
-    return list(unique.values())
+def yahoo_site_results_last5d(portal_name: str, role_query: str = "", location_query: str = "") -> List[Dict[str, str]]:
+    site_query = YAHOO_DOMAINS.get(portal_name)
+    if not site_query:
+        return []
+
+    query_parts = [f"site:{site_query}"]
+    if role_query.strip():
+        query_parts.append(f'"{role_query.strip()}"')
+    if location_query.strip():
+        query_parts.append(location_query.strip())
+    query_parts.append("jobs")
+    query_parts.append("last 5 days")
+    query = " ".join(query_parts)
 
+    context = {"portals": [portal_name], "roles": [role_query], "location": location_query}
+    hits = _yahoo_search(query, context)
+    return _assign_yahoo_hits(hits, [portal_name], [role_query], location_query)[role_query]
+
+
+def yahoo_site_results_batched(
+    portal_names: List[str], role_queries: List[str], location_query: str = ""
+) -> Dict[str, List[Dict[str, str]]]:
+    """Run one OR-combined Yahoo query for several portals and roles.
+
+    Each hit is assigned back to every role whose filters it passes, so the
+    result is keyed by role just as if the roles had been searched one by one.
+    """
+    portal_names = [p for p in portal_names if p in YAHOO_DOMAINS]
+    role_queries = list(role_queries) or [""]
+    if not portal_names:
+        return {role: [] for role in role_queries}
+    if len(portal_names) == 1 and len(role_queries) == 1:
+        return {role_queries[0]: yahoo_site_results_last5d(portal_names[0], role_queries[0], location_query)}
+
+    sites = [f"site:{YAHOO_DOMAINS[p]}" for p in portal_names]
+    query_parts = [sites[0] if len(sites) == 1 else "(" + " OR ".join(sites) + ")"]
+    role_terms = [f'"{r.strip()}"' for r in role_queries if r.strip()]
+    if len(role_terms) == 1:
+        query_parts.append(role_terms[0])
+    elif role_terms:
+        query_parts.append("(" + " OR ".join(role_terms) + ")")
+    if location_query.strip():
+        query_parts.append(location_query.strip())
+    query_parts.append("jobs")
+    query_parts.append("last 5 days")
+    query = " ".join(query_parts)
 
-def _write_xlsx(rows: List[Dict[str, str]], output_file: str) -> None:
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "Jobs"
+    context = {"portals": portal_names, "roles": role_queries, "location": location_query}
+    return _assign_yahoo_hits(_yahoo_search(query, context), portal_names, role_queries, location_query)
 
-    headers = ["title", "company", "location", "platform", "source", "url", "posted_at"]
-    ws.append(headers)
 
+def _dedupe(rows: Iterable[Dict[str, str]], max_seen: int = DEDUPE_WINDOW) -> Iterator[Dict[str, str]]:
+    """Yield the first occurrence of each job, remembering at most ``max_seen`` keys."""
+    seen: "OrderedDict[bytes, None]" = OrderedDict()
     for row in rows:
-        ws.append([row.get(col, "") for col in headers])
+        key = "\x1f".join((row.get("title", "").lower(), row.get("company", "").lower(), row.get("url", "")))
+        digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+        if digest in seen:
+            seen.move_to_end(digest)
+            continue
+        seen[digest] = None
+        if len(seen) > max_seen:
+            seen.popitem(last=False)
+        yield row
+
+
+def _write_xlsx(
+    rows: Iterable[Dict[str, str]],
+    output_file: str,
+    unit_status: Optional[Dict[str, str]] = None,
+    delta: Optional[DeltaTracker] = None,
+) -> int:
+    """Stream rows into a write-only workbook and return how many jobs were written.
+
+    With a DeltaTracker, every row is also checked for changes on the way
+    through and the "Delta" sheet is filled in the same pass.
+    """
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet("Jobs")
+    delta_ws = wb.create_sheet("Delta") if delta is not None else None
+    run_ws = wb.create_sheet("Run") if unit_status else None
 
-    url_col_idx = headers.index("url") + 1
-    for row_idx in range(2, ws.max_row + 1):
-        cell = ws.cell(row=row_idx, column=url_col_idx)
-        value = str(cell.value or "").strip()
-        if value.startswith("http://") or value.startswith("https://"):
-            cell.hyperlink = value
-            cell.style = "Hyperlink"
+    headers = ["title", "company", "location", "platform", "source", "url", "posted_at"]
+    ws.append(headers)
+    if delta_ws is not None:
+        delta_ws.append(["change"] + headers)
+
+    link_counts: Dict[str, int] = {}
+
+    def cells(row: Dict[str, str], sheet) -> list:
+        values = []
+        for col in headers:
+            value = row.get(col, "")
+            url = str(value or "").strip()
+            if (
+                col == "url"
+                and (url.startswith("http://") or url.startswith("https://"))
+                and link_counts.get(sheet.title, 0) < MAX_HYPERLINKS_PER_SHEET
+            ):
+                link_counts[sheet.title] = link_counts.get(sheet.title, 0) + 1
+                cell = WriteOnlyCell(sheet, value=value)
+                cell.hyperlink = url
+                cell.style = "Hyperlink"
+                value = cell
+            values.append(value)
+        return values
+
+    count = 0
+    for row in rows:
+        ws.append(cells(row, ws))
+        count += 1
+        if delta is not None:
+            change = delta.observe(row)
+            if change:
+                delta_ws.append([change] + cells(row, delta_ws))
+
+    if delta is not None:
+        for row in delta.finish():
+            delta_ws.append([row["change"]] + cells(row, delta_ws))
+
+    if run_ws is not None:
+        run_ws.append(["query_unit", "status"])
+        for unit, status in unit_status.items():
+            run_ws.append([unit, status])
 
     wb.save(output_file)
+    return count
+
+
+QueryUnit = Tuple[str, Callable[[], List[Dict[str, str]]]]
+
+
+def _query_units(roles: List[str], locations: List[str]) -> Iterator[QueryUnit]:
+    """Yield (unit_key, run) pairs; a unit is the smallest piece of work that is journaled."""
+    searches = [(role, location) for location in locations for role in roles]
+    if LINKEDIN_TABS > 1:
+        # Tab groups span locations, so every browser started fills all of its tabs.
+        for group in _chunks(searches, LINKEDIN_TABS):
+            yield (
+                "LinkedIn|" + ";".join(f"{role}|{location}" for role, location in group),
+                lambda group=group: [row for rows in scrape_linkedin_tabs(group).values() for row in rows],
+            )
+    else:
+        for role, location in searches:
+            yield (
+                f"LinkedIn|{role}|{location}",
+                lambda role=role, location=location: scrape_linkedin_last24h(role, location),
+            )
+    for location in locations:
+        for portal_group in _chunks(YAHOO_PORTALS, YAHOO_PORTAL_BATCH_SIZE):
+            for role_group in _chunks(roles, YAHOO_ROLE_BATCH_SIZE):
+                yield (
+                    f"{','.join(portal_group)}|{','.join(role_group)}|{location}",
+                    lambda portal_group=portal_group, role_group=role_group, location=location: [
+                        row
+                        for role_rows in yahoo_site_results_batched(portal_group, role_group, location).values()
+                        for row in role_rows
+                    ],
+                )
+
+
+def _unit_priority(unit: str) -> int:
+    portals = unit.split("|", 1)[0].split(",")
+    return min(PORTAL_PRIORITY.get(p, len(PORTAL_PRIORITY)) for p in portals)
+
+
+def journal_path() -> str:
+    if JOURNAL_FILE:
+        return JOURNAL_FILE
+    return os.path.join(STATE_DIR, "journals", f"{os.path.basename(OUTPUT_FILE)}.journal.jsonl")
 
 
 def main() -> None:
-    rows: List[Dict[str, str]] = []
+    global _deadline_cut, _run_id
 
     roles = HR_KEYWORDS or [""]
     locations = LOCATION_QUERIES or [""]
+    os.makedirs(os.path.dirname(os.path.abspath(journal_path())), exist_ok=True)
+    journal = RunJournal(journal_path(), resume=RESUME)
+    units = sorted(_query_units(roles, locations), key=lambda u: _unit_priority(u[0]))
+    unit_status: Dict[str, str] = {unit: "skipped" for unit, _ in units}
+    _start_deadline()
+    _run_id = dt.datetime.now(dt.timezone.utc).isoformat()
 
-    for role in roles:
-        for location in locations:
-            rows.extend(scrape_linkedin_last24h(role, location))
-            for portal in ("Naukri", "Indeed", "Foundit", "Glassdoor"):
-                rows.extend(yahoo_site_results_last5d(portal, role, location))
-
-    rows = _dedupe(rows)
-    _write_xlsx(rows, OUTPUT_FILE)
+    try:
+        for unit, run in units:
+            if journal.is_done(unit):
+                print(f"[info] Skipping completed unit: {unit}")
+                unit_status[unit] = "completed"
+                continue
+            if _deadline_reached():
+                print(f"[warn] Deadline reached; skipping unit: {unit}")
+                continue
+            _deadline_cut = False
+            try:
+                rows = run()
+            except Exception as exc:
+                # Not journaled, so --resume retries it; the rest of the run goes on.
+                print(f"[warn] Query unit failed: {unit}: {exc!r}")
+                unit_status[unit] = "failed"
+                continue
+            # A unit still running when the deadline passed may have lost fetches too.
+            cut = _deadline_cut or _deadline_reached()
+            journal.record(unit, rows, complete=not cut)
+            unit_status[unit] = "partial" if cut else "completed"
+    finally:
+        # Journal -> dedupe -> (delta) -> workbook, one row at a time.
+        skipped = sum(1 for status in unit_status.values() if status != "completed")
+        delta = DeltaTracker(DELTA_STATE_FILE, complete_run=not skipped) if DELTA_STATE_FILE else None
+        try:
+            count = _write_xlsx(_dedupe(journal.iter_rows()), OUTPUT_FILE, unit_status, delta)
+        finally:
+            if delta is not None:
+                delta.close()
+        if delta is not None:
+            c = delta.counts
+            print(f"[info] Delta: {c['new']} new, {c['changed']} changed, {c['disappeared']} disappeared")
+        if INDEX_DB:
+            from job_index import JobIndex
+
+            with JobIndex(INDEX_DB) as index:
+                index.add_journal(journal_path())
+        if not skipped and not JOURNAL_FILE:
+            os.remove(journal_path())
+        print(f"[done] {len(unit_status) - skipped}/{len(unit_status)} query units completed, {count} jobs")
 
 
 if __name__ == "__main__":
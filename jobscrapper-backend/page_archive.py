@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import argparse
+import datetime as dt
+import gzip
+import hashlib
+import json
+import os
+import time
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+except ModuleNotFoundError:
+    zstandard = None
+
+
+class PageArchive:
+    """Content-addressed store of fetched pages plus a JSONL metadata index.
+
+    Page bodies live under ``objects/<2 hex>/<sha256>.html.zst`` (or ``.gz``
+    when ``zstandard`` is not installed); identical pages are stored once.
+    Every fetch still gets its own index line, so the archive can be replayed
+    through the parsers with the context each page was fetched under.
+    """
+
+    def __init__(self, root: str) -> None:
+        self.root = root
+        self.index_path = os.path.join(root, "index.jsonl")
+        os.makedirs(os.path.join(root, "objects"), exist_ok=True)
+
+    def _object_path(self, digest: str, codec: str) -> str:
+        return os.path.join(self.root, "objects", digest[:2], f"{digest}.html.{codec}")
+
+    def put(self, kind: str, url: str, html: str, meta: Optional[Dict] = None) -> str:
+        body = html.encode("utf-8")
+        digest = hashlib.sha256(body).hexdigest()
+        codec = "zst" if zstandard is not None else "gz"
+        path = self._object_path(digest, codec)
+        if not os.path.exists(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            if codec == "zst":
+                data = zstandard.ZstdCompressor(level=10).compress(body)
+            else:
+                data = gzip.compress(body, compresslevel=6)
+            tmp_path = f"{path}.tmp"
+            with open(tmp_path, "wb") as fh:
+                fh.write(data)
+            os.replace(tmp_path, path)
+
+        entry = {
+            "digest": digest,
+            "codec": codec,
+            "kind": kind,
+            "url": url,
+            "fetched_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "size": len(body),
+            "meta": meta or {},
+        }
+        with open(self.index_path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+        return digest
+
+    def read(self, digest: str, codec: str) -> str:
+        with open(self._object_path(digest, codec), "rb") as fh:
+            data = fh.read()
+        if codec == "zst":
+            if zstandard is None:
+                raise RuntimeError("Archive contains zstd pages; install with: pip install zstandard")
+            return zstandard.ZstdDecompressor().decompress(data).decode("utf-8")
+        return gzip.decompress(data).decode("utf-8")
+
+    def iter_entries(self, kind: Optional[str] = None) -> Iterator[Dict]:
+        if not os.path.exists(self.index_path):
+            return
+        with open(self.index_path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if kind and entry.get("kind") != kind:
+                    continue
+                yield entry
+
+    def iter_pages(self, kind: Optional[str] = None) -> Iterator[Tuple[Dict, str]]:
+        for entry in self.iter_entries(kind):
+            yield entry, self.read(entry["digest"], entry["codec"])
+
+
+def reparse(archive_dir: str, output_file: str, kind: Optional[str] = None) -> None:
+    """Run the current scraper parsers over every archived page and export the rows.
+
+    Each page is parsed with the age limit and per-query result caps of the
+    run that fetched it; pages archived before those were recorded fall back
+    to the scraper defaults.
+    """
+    import linkedin_scraper as scraper
+
+    deps = scraper._require_scraper_deps()
+    archive = PageArchive(archive_dir)
+    stats = {"pages": 0, "bytes": 0}
+    defaults = (scraper.MAX_JOB_AGE_DAYS, scraper.MAX_RESULTS_PER_QUERY, scraper.ROLE_QUERY_WEIGHTS)
+    taken: Dict[Tuple, int] = {}
+
+    def capped(key: Tuple, role: str, rows: List[Dict]) -> List[Dict]:
+        # The cap applies per search across all of its pages, as it did when fetched.
+        room = max(0, scraper._result_cap(role) - taken.get(key, 0))
+        taken[key] = taken.get(key, 0) + min(room, len(rows))
+        return rows[:room]
+
+    def parsed_rows() -> Iterator[Dict]:
+        for entry, html in archive.iter_pages(kind):
+            meta = entry.get("meta") or {}
+            stats["pages"] += 1
+            stats["bytes"] += len(html)
+            scraper.MAX_JOB_AGE_DAYS = meta.get("max_days", defaults[0])
+            scraper.MAX_RESULTS_PER_QUERY = meta.get("max_results", defaults[1])
+            scraper.ROLE_QUERY_WEIGHTS = meta.get("role_weights", {})
+            run = meta.get("run")
+            if entry["kind"] == "linkedin":
+                role, location = meta.get("role", ""), meta.get("location", "")
+                rows = scraper._parse_linkedin_cards(deps, html, role, location)
+                yield from capped((run, "linkedin", role, location), role, rows)
+            elif entry["kind"] == "yahoo":
+                hits = scraper._parse_yahoo_results(deps, html)
+                assigned = scraper._assign_yahoo_hits(
+                    hits, meta.get("portals") or [], meta.get("roles") or [""], meta.get("location", "")
+                )
+                for role, role_rows in assigned.items():
+                    yield from capped((run, "yahoo", meta.get("query"), role), role, role_rows)
+
+    started = time.perf_counter()
+    try:
+        count = scraper._write_xlsx(scraper._dedupe(parsed_rows()), output_file)
+    finally:
+        scraper.MAX_JOB_AGE_DAYS, scraper.MAX_RESULTS_PER_QUERY, scraper.ROLE_QUERY_WEIGHTS = defaults
+    elapsed = time.perf_counter() - started
+    rate = stats["bytes"] / elapsed / 1e6 if elapsed else 0.0
+    print(f"[done] Re-parsed {stats['pages']} pages ({rate:.1f} MB/s) into {count} jobs -> {output_file}")
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Inspect or re-parse archived scraper pages.")
+    parser.add_argument("--archive-dir", required=True, help="Archive directory written by a scraper run")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    reparse_cmd = sub.add_parser("reparse", help="Re-run the parsers over archived pages")
+    reparse_cmd.add_argument("--output-file", required=True, help="Output xlsx path")
+    reparse_cmd.add_argument("--kind", choices=["linkedin", "yahoo"], help="Only re-parse one page kind")
+
+    sub.add_parser("stats", help="Summarize archive contents")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = parse_args()
+    if args.command == "reparse":
+        reparse(args.archive_dir, args.output_file, args.kind)
+        return
+
+    archive = PageArchive(args.archive_dir)
+    counts: Dict[str, int] = {}
+    digests = set()
+    for entry in archive.iter_entries():
+        counts[entry["kind"]] = counts.get(entry["kind"], 0) + 1
+        digests.add(entry["digest"])
+    print(json.dumps({"fetches": counts, "unique_pages": len(digests)}, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,256 @@
+from __future__ import annotations
+
+import math
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+# Small built-in gazetteer: place -> every broader region that contains it.
+# Keys and values are normalized (lowercase, single spaces).
+GAZETTEER: Dict[str, Set[str]] = {
+    "new delhi": {"delhi", "delhi ncr", "india"},
+    "delhi": {"delhi ncr", "india"},
+    "noida": {"uttar pradesh", "delhi ncr", "india"},
+    "greater noida": {"uttar pradesh", "delhi ncr", "india"},
+    "ghaziabad": {"uttar pradesh", "delhi ncr", "india"},
+    "gurugram": {"haryana", "delhi ncr", "india"},
+    "faridabad": {"haryana", "delhi ncr", "india"},
+    "delhi ncr": {"india"},
+    "lucknow": {"uttar pradesh", "india"},
+    "mumbai": {"maharashtra", "india"},
+    "navi mumbai": {"maharashtra", "india"},
+    "thane": {"maharashtra", "india"},
+    "pune": {"maharashtra", "india"},
+    "bengaluru": {"karnataka", "india"},
+    "mysuru": {"karnataka", "india"},
+    "hyderabad": {"telangana", "india"},
+    "chennai": {"tamil nadu", "india"},
+    "coimbatore": {"tamil nadu", "india"},
+    "kolkata": {"west bengal", "india"},
+    "ahmedabad": {"gujarat", "india"},
+    "jaipur": {"rajasthan", "india"},
+    "chandigarh": {"india"},
+    "kochi": {"kerala", "india"},
+    "uttar pradesh": {"india"},
+    "haryana": {"india"},
+    "maharashtra": {"india"},
+    "karnataka": {"india"},
+    "telangana": {"india"},
+    "tamil nadu": {"india"},
+    "west bengal": {"india"},
+    "gujarat": {"india"},
+    "rajasthan": {"india"},
+    "kerala": {"india"},
+}
+
+ALIASES = {
+    "gurgaon": "gurugram",
+    "bangalore": "bengaluru",
+    "bombay": "mumbai",
+    "madras": "chennai",
+    "calcutta": "kolkata",
+    "mysore": "mysuru",
+    "cochin": "kochi",
+    "ncr": "delhi ncr",
+    "delhi/ncr": "delhi ncr",
+    "up": "uttar pradesh",
+}
+
+
+def _normalize_place(value: str) -> str:
+    place = re.sub(r"\s+", " ", (value or "").strip().lower())
+    return ALIASES.get(place, place)
+
+
+def _role_tokens(role: str) -> frozenset:
+    # Same tokens _matches_filters uses for role matching.
+    return frozenset(tok for tok in re.split(r"[^a-z0-9]+", (role or "").lower()) if len(tok) >= 2)
+
+
+def qualified_place(parts: List[str]) -> Optional[str]:
+    """Return the place of "Noida, Uttar Pradesh, India", or None for a list of places.
+
+    A comma-separated string whose trailing parts are all regions containing
+    its first part names one place; the regions only qualify it.
+    """
+    parts = [p.strip() for p in parts if p.strip()]
+    if len(parts) < 2:
+        return None
+    regions = GAZETTEER.get(_normalize_place(parts[0]), set())
+    if all(_normalize_place(p) in regions for p in parts[1:]):
+        return parts[0]
+    return None
+
+
+def collapse_locations(locations: Iterable[str]) -> Dict[str, str]:
+    """Map each input location to the kept location that covers it (itself if kept).
+
+    A location is dropped when it is an alias or duplicate of another, or when
+    the gazetteer puts it inside another requested region; searching the
+    broader region returns its postings as well.
+    """
+    ordered = [loc for loc in locations if loc.strip()]
+    canonical: Dict[str, str] = {}
+    for loc in ordered:
+        canonical.setdefault(_normalize_place(loc), loc)
+
+    covered_by: Dict[str, str] = {}
+    for loc in ordered:
+        place = _normalize_place(loc)
+        parents = [canonical[p] for p in GAZETTEER.get(place, ()) if p in canonical]
+        if parents:
+            # Prefer the narrowest requested parent, i.e. the one with the most ancestors itself.
+            covered_by[loc] = max(parents, key=lambda p: (len(GAZETTEER.get(_normalize_place(p), ())), p))
+        elif canonical[place] != loc:
+            covered_by[loc] = canonical[place]
+        else:
+            covered_by[loc] = loc
+
+    # Follow chains (Noida -> Uttar Pradesh -> India) to the location actually kept.
+    for loc in covered_by:
+        target = covered_by[loc]
+        while covered_by.get(target, target) != target:
+            target = covered_by[target]
+        covered_by[loc] = target
+    return covered_by
+
+
+def _alias_spellings(location: str) -> List[str]:
+    """Every name of the same place ("Gurgaon" -> ["gurgaon", "gurugram"]), for the location filter."""
+    place = _normalize_place(location)
+    return sorted({place} | {alias for alias, target in ALIASES.items() if target == place})
+
+
+def _location_covers(location_map: Dict[str, str], location: str) -> List[str]:
+    names = set()
+    for loc, target in location_map.items():
+        if target == location:
+            names.add(loc.strip().lower())
+            names.update(_alias_spellings(loc))
+    return sorted(names - {location.strip().lower()})
+
+
+def merge_roles(roles: Iterable[str]) -> Dict[str, str]:
+    """Map each role to the kept role that covers it (itself if kept).
+
+    Role matching accepts any role token, so a role whose token set contains
+    another role's tokens ("Technical Recruiter" vs "Recruiter") is already
+    covered by the broader query. See ``plan_queries`` for its result cap.
+    """
+    ordered = [r for r in roles if r.strip()]
+    tokens = {role: _role_tokens(role) for role in ordered}
+    covered_by: Dict[str, str] = {}
+    for role in ordered:
+        broader = [
+            other
+            for other in ordered
+            if other != role
+            and tokens[other]
+            and tokens[other] <= tokens[role]
+            and (tokens[other] < tokens[role] or ordered.index(other) < ordered.index(role))
+        ]
+        if broader:
+            covered_by[role] = min(broader, key=lambda r: (len(tokens[r]), ordered.index(r)))
+        else:
+            covered_by[role] = role
+
+    for role in covered_by:
+        target = covered_by[role]
+        while covered_by[target] != target:
+            target = covered_by[target]
+        covered_by[role] = target
+    return covered_by
+
+
+def plan_queries(
+    roles: List[str],
+    locations: List[str],
+    platforms: Iterable[str],
+    yahoo_portals: Iterable[str],
+    search_pages: int = 1,
+    linkedin_tabs: int = 1,
+    yahoo_role_batch: int = 1,
+    yahoo_portal_batch: int = 1,
+    prune: bool = True,
+) -> Dict:
+    """Reduce roles/locations to a minimal set and estimate the requests it will cost.
+
+    ``location_covers`` lists, per kept location, the requested places it
+    stands in for and their other spellings. Card locations rarely name the
+    broader region ("Noida, Uttar Pradesh" under a "Delhi NCR" search), so the
+    location filter has to accept those places' tokens too; see
+    ``run_scraper_wrapper``.
+
+    ``role_weights`` counts, per kept role covering more than one distinct
+    role, the roles it searches for; its result cap is that many times
+    MAX_RESULTS_PER_QUERY, so merging does not shrink any role's share.
+
+    With ``prune=False`` nothing is dropped and only the request counts are
+    planned.
+    """
+    if prune:
+        role_map = merge_roles(roles)
+        location_map = collapse_locations(locations)
+    else:
+        role_map = {r: r for r in roles if r.strip()}
+        location_map = {l: l for l in locations if l.strip()}
+    kept_roles = [r for r in role_map if role_map[r] == r] or [""]
+    kept_locations = [l for l in location_map if location_map[l] == l] or [""]
+
+    selected = {p.strip().lower() for p in platforms}
+    portals = [p for p in yahoo_portals if p.lower() in selected]
+
+    def cost(n_roles: int, n_locations: int) -> Dict[str, int]:
+        linkedin_pages = n_roles * n_locations * search_pages if "linkedin" in selected else 0
+        browsers = 0
+        if linkedin_pages:
+            # Tab groups span locations (see _query_units).
+            browsers = math.ceil(n_roles * n_locations / linkedin_tabs) if linkedin_tabs > 1 else n_roles * n_locations
+        yahoo_serps = 0
+        if portals:
+            yahoo_serps = (
+                math.ceil(len(portals) / max(1, yahoo_portal_batch))
+                * math.ceil(n_roles / max(1, yahoo_role_batch))
+                * n_locations
+                * search_pages
+            )
+        return {
+            "linkedin_pages": linkedin_pages,
+            "browser_sessions": browsers,
+            "yahoo_serps": yahoo_serps,
+            "total_fetches": linkedin_pages + yahoo_serps,
+        }
+
+    weights = {}
+    for role in kept_roles:
+        distinct = {_role_tokens(r) for r, t in role_map.items() if t == role}
+        if len(distinct) > 1:
+            weights[role] = len(distinct)
+
+    return {
+        "roles": kept_roles,
+        "locations": kept_locations,
+        "merged_roles": {r: t for r, t in role_map.items() if r != t},
+        "collapsed_locations": {l: t for l, t in location_map.items() if l != t},
+        "location_covers": {loc: _location_covers(location_map, loc) for loc in kept_locations if loc and prune},
+        "role_weights": weights,
+        "requests": cost(len(kept_roles), len(kept_locations)),
+        "requests_unplanned": cost(max(1, len([r for r in roles if r.strip()])), max(1, len([l for l in locations if l.strip()]))),
+    }
+
+
+def describe_plan(plan: Dict) -> str:
+    lines = [f"[plan] roles: {', '.join(plan['roles']) or '(any)'}"]
+    lines.append(f"[plan] locations: {', '.join(plan['locations']) or '(any)'}")
+    for role, target in plan["merged_roles"].items():
+        lines.append(f"[plan] role '{role}' merged into '{target}'")
+    for role, weight in plan["role_weights"].items():
+        lines.append(f"[plan] role '{role}' result cap x{weight}")
+    for loc, target in plan["collapsed_locations"].items():
+        lines.append(f"[plan] location '{loc}' folded into '{target}'")
+    before, after = plan["requests_unplanned"], plan["requests"]
+    lines.append(
+        f"[plan] fetches: {after['total_fetches']} (was {before['total_fetches']}); "
+        f"LinkedIn pages {after['linkedin_pages']}, Yahoo SERPs {after['yahoo_serps']}, "
+        f"browser sessions {after['browser_sessions']}"
+    )
+    return "\n".join(lines)
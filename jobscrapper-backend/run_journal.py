@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import datetime as dt
+import json
+import os
+from typing import Dict, Iterator, List, Set
+
+
+class RunJournal:
+    """Append-only JSONL log of finished query units and the rows they produced.
+
+    Every entry is flushed and fsynced as soon as its unit finishes, so a crash
+    loses at most the unit that was in flight. A torn trailing line left by a
+    crash is ignored on read. Units cut short by a deadline are logged with
+    ``complete: false``; their rows are kept but the unit is rerun on resume.
+    """
+
+    def __init__(self, path: str, resume: bool = False) -> None:
+        self.path = path
+        if not resume and os.path.exists(path):
+            os.remove(path)
+        self._terminate_torn_line()
+        self._completed: Set[str] = {
+            entry["unit"] for entry in self._entries() if entry.get("complete", True)
+        }
+
+    def _terminate_torn_line(self) -> None:
+        if not os.path.exists(self.path) or os.path.getsize(self.path) == 0:
+            return
+        with open(self.path, "rb+") as fh:
+            fh.seek(-1, os.SEEK_END)
+            if fh.read(1) != b"\n":
+                fh.write(b"\n")
+
+    def _entries(self) -> Iterator[Dict]:
+        if not os.path.exists(self.path):
+            return
+        with open(self.path, "r", encoding="utf-8") as fh:
+            for line in fh:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    entry = json.loads(line)
+                except ValueError:
+                    continue
+                if isinstance(entry, dict) and "unit" in entry:
+                    yield entry
+
+    def is_done(self, unit: str) -> bool:
+        return unit in self._completed
+
+    @property
+    def completed_units(self) -> Set[str]:
+        return set(self._completed)
+
+    def record(self, unit: str, rows: List[Dict[str, str]], complete: bool = True) -> None:
+        entry = {
+            "unit": unit,
+            "complete": complete,
+            "completed_at": dt.datetime.now(dt.timezone.utc).isoformat(),
+            "rows": rows,
+        }
+        with open(self.path, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(entry, ensure_ascii=False) + "\n")
+            fh.flush()
+            os.fsync(fh.fileno())
+        if complete:
+            self._completed.add(unit)
+
+    def iter_rows(self) -> Iterator[Dict[str, str]]:
+        for entry in self._entries():
+            yield from entry.get("rows") or []
@@ -1,6 +1,7 @@
 import argparse
 import importlib.util
 import os
+import sys
 
 
 def parse_args():
@@ -10,6 +11,39 @@ def parse_args():
     parser.add_argument("--platforms", default="LinkedIn", help="Comma-separated platforms")
     parser.add_argument("--time-filter", default="Last 5 Days", help="Time filter text")
     parser.add_argument("--output-file", required=True, help="Absolute output file path")
+    parser.add_argument(
+        "--yahoo-role-batch", type=int, default=None, help="Roles OR-combined per Yahoo site query (default 1, no batching)"
+    )
+    parser.add_argument(
+        "--yahoo-portal-batch", type=int, default=None, help="Portals OR-combined per Yahoo site query (default 1, no batching)"
+    )
+    parser.add_argument(
+        "--linkedin-tabs", type=int, default=None, help="Concurrent LinkedIn search tabs in one browser"
+    )
+    parser.add_argument(
+        "--journal-file", default="", help="Checkpoint journal path (default: a private file removed after a complete run)"
+    )
+    parser.add_argument(
+        "--resume", action="store_true", help="Skip query units already recorded in the journal"
+    )
+    parser.add_argument(
+        "--deadline", type=float, default=0, help="Time budget in seconds; partial results are written when it runs out"
+    )
+    parser.add_argument(
+        "--index-db", default="", help="Search index to update with this run's results (see job_index.py)"
+    )
+    parser.add_argument(
+        "--archive-dir", default="", help="Archive fetched LinkedIn/Yahoo pages here (see page_archive.py reparse)"
+    )
+    parser.add_argument(
+        "--delta-state-dir", default="", help="Directory of per-search fingerprints for the new/changed/disappeared feed"
+    )
+    parser.add_argument(
+        "--no-plan", action="store_true", help="Search every role/location as given instead of pruning redundant ones"
+    )
+    parser.add_argument(
+        "--plan-only", action="store_true", help="Print the query plan and expected request counts, then exit"
+    )
     return parser.parse_args()
 
 
@@ -23,8 +57,16 @@ def split_multi_role(raw):
 
 
 def split_multi_location(raw):
-    normalized = (raw or "").replace("\n", "|").replace(";", "|").replace(",", "|")
-    return [item.strip() for item in normalized.split("|") if item.strip()]
+    from query_planner import qualified_place
+
+    normalized = (raw or "").replace("\n", "|").replace(";", "|")
+    locations = []
+    for entry in normalized.split("|"):
+        parts = [item.strip() for item in entry.split(",") if item.strip()]
+        # "Noida, Uttar Pradesh, India" is one place, not three.
+        place = qualified_place(parts)
+        locations.extend([place] if place else parts)
+    return locations
 
 
 def map_max_days(time_filter):
@@ -41,6 +83,8 @@ def main():
     script_dir = os.path.abspath(os.path.dirname(__file__))
     backend_root = os.path.abspath(os.path.join(script_dir, ".."))
     scraper_path = os.path.join(backend_root, "linkedin_scraper.py")
+    if backend_root not in sys.path:
+        sys.path.insert(0, backend_root)
 
     spec = importlib.util.spec_from_file_location("backend_linkedin_scraper", scraper_path)
     if not spec or not spec.loader:
@@ -54,6 +98,11 @@ def main():
     selected = normalize_platforms(args.platforms)
     scraper.OUTPUT_FILE = args.output_file
     scraper.MAX_JOB_AGE_DAYS = map_max_days(args.time_filter)
+    scraper.JOURNAL_FILE = args.journal_file
+    scraper.RESUME = args.resume
+    scraper.DEADLINE_SECONDS = max(0, args.deadline)
+    scraper.ARCHIVE_DIR = args.archive_dir
+    scraper.INDEX_DB = args.index_db
 
     roles = split_multi_role(args.role)
     scraper.HR_KEYWORDS = roles or [""]
@@ -61,22 +110,84 @@ def main():
     locations = split_multi_location(args.location)
     scraper.LOCATION_QUERIES = locations or [""]
 
+    if args.yahoo_role_batch is not None:
+        scraper.YAHOO_ROLE_BATCH_SIZE = max(1, args.yahoo_role_batch)
+    if args.yahoo_portal_batch is not None:
+        scraper.YAHOO_PORTAL_BATCH_SIZE = max(1, args.yahoo_portal_batch)
+
+    if args.linkedin_tabs is not None:
+        scraper.LINKEDIN_TABS = max(1, args.linkedin_tabs)
+
+    # Only batch the portals that will actually be searched.
+    scraper.YAHOO_PORTALS = tuple(p for p in scraper.YAHOO_PORTALS if p.lower() in selected)
+
+    from query_planner import describe_plan, plan_queries
+
+    plan = plan_queries(
+        roles,
+        locations,
+        selected,
+        scraper.YAHOO_PORTALS,
+        search_pages=scraper.SEARCH_PAGES,
+        linkedin_tabs=scraper.LINKEDIN_TABS,
+        yahoo_role_batch=scraper.YAHOO_ROLE_BATCH_SIZE,
+        yahoo_portal_batch=scraper.YAHOO_PORTAL_BATCH_SIZE,
+        prune=not args.no_plan,
+    )
+    print(describe_plan(plan))
+    if args.plan_only:
+        return
+    scraper.HR_KEYWORDS = plan["roles"]
+    scraper.LOCATION_QUERIES = plan["locations"]
+    scraper.ROLE_QUERY_WEIGHTS = plan["role_weights"]
+    location_covers = plan["location_covers"]
+
+    original_matches_filters = scraper._matches_filters
+
+    def matches_filters_guard(title, location, role_query, location_query):
+        for loc in [location_query] + location_covers.get(location_query, []):
+            if original_matches_filters(title, location, role_query, loc):
+                return True
+        return False
+
+    scraper._matches_filters = matches_filters_guard
+
+    if args.delta_state_dir:
+        from job_delta import search_state_path
+
+        scraper.DELTA_STATE_FILE = search_state_path(
+            args.delta_state_dir, scraper.HR_KEYWORDS, scraper.LOCATION_QUERIES, sorted(selected)
+        )
+
     original_linkedin = scraper.scrape_linkedin_last24h
+    original_linkedin_tabs = scraper.scrape_linkedin_tabs
     original_yahoo = scraper.yahoo_site_results_last5d
+    original_yahoo_batched = scraper.yahoo_site_results_batched
 
     def linkedin_guard(*func_args, **func_kwargs):
         if "linkedin" not in selected:
             return []
         return original_linkedin(*func_args, **func_kwargs)
 
+    def linkedin_tabs_guard(queries, *func_args, **func_kwargs):
+        if "linkedin" not in selected:
+            return {query: [] for query in queries}
+        return original_linkedin_tabs(queries, *func_args, **func_kwargs)
+
     def yahoo_guard(portal_name, *func_args, **func_kwargs):
         portal_key = str(portal_name).strip().lower()
         if portal_key not in selected:
             return []
         return original_yahoo(portal_name, *func_args, **func_kwargs)
 
+    def yahoo_batched_guard(portal_names, *func_args, **func_kwargs):
+        allowed = [p for p in portal_names if str(p).strip().lower() in selected]
+        return original_yahoo_batched(allowed, *func_args, **func_kwargs)
+
     scraper.scrape_linkedin_last24h = linkedin_guard
+    scraper.scrape_linkedin_tabs = linkedin_tabs_guard
     scraper.yahoo_site_results_last5d = yahoo_guard
+    scraper.yahoo_site_results_batched = yahoo_batched_guard
 
     scraper.main()
 
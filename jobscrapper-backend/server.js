@@ -13,6 +13,11 @@ const DOWNLOADS_DIR = path.resolve(__dirname, "downloads");
 const WRAPPER_PATH = path.resolve(__dirname, "scripts", "run_scraper_wrapper.py");
 const PYTHON_BIN = process.env.PYTHON_BIN || "python";
 const PORT = Number(process.env.PORT || 4000);
+const SCRAPER_DEADLINE_SECONDS = Number(process.env.SCRAPER_DEADLINE_SECONDS || 0);
+const JOBS_INDEX_DB = process.env.JOBS_INDEX_DB || "";
+const DELTA_STATE_DIR = process.env.DELTA_STATE_DIR || "";
+const YAHOO_ROLE_BATCH = Number(process.env.YAHOO_ROLE_BATCH || 0);
+const YAHOO_PORTAL_BATCH = Number(process.env.YAHOO_PORTAL_BATCH || 0);
 
 fs.mkdirSync(DOWNLOADS_DIR, { recursive: true });
 
@@ -54,6 +59,21 @@ app.post("/api/run-scraper", async (req, res) => {
       "--output-file",
       outputPath
     ];
+    if (SCRAPER_DEADLINE_SECONDS > 0) {
+      args.push("--deadline", String(SCRAPER_DEADLINE_SECONDS));
+    }
+    if (JOBS_INDEX_DB) {
+      args.push("--index-db", JOBS_INDEX_DB);
+    }
+    if (DELTA_STATE_DIR) {
+      args.push("--delta-state-dir", DELTA_STATE_DIR);
+    }
+    if (YAHOO_ROLE_BATCH > 1) {
+      args.push("--yahoo-role-batch", String(YAHOO_ROLE_BATCH));
+    }
+    if (YAHOO_PORTAL_BATCH > 1) {
+      args.push("--yahoo-portal-batch", String(YAHOO_PORTAL_BATCH));
+    }
 
     const { stdout, stderr } = await runProcess(PYTHON_BIN, args, PROJECT_ROOT);
 
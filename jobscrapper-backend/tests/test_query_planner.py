@@ -0,0 +1,77 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), "..")))
+
+from query_planner import collapse_locations, merge_roles, plan_queries, qualified_place  # noqa: E402
+
+
+def kept(mapping):
+    return [key for key, target in mapping.items() if key == target]
+
+
+def test_collapse_locations_keeps_broader_region():
+    assert collapse_locations(["Delhi NCR", "Noida"]) == {"Delhi NCR": "Delhi NCR", "Noida": "Delhi NCR"}
+    assert collapse_locations(["Faridabad", "Haryana"]) == {"Faridabad": "Haryana", "Haryana": "Haryana"}
+    assert collapse_locations(["Delhi", "New Delhi"]) == {"Delhi": "Delhi", "New Delhi": "Delhi"}
+
+
+def test_collapse_locations_keeps_places_outside_requested_regions():
+    mapping = collapse_locations(["Delhi", "Noida", "Gurugram", "Haryana"])
+    assert kept(mapping) == ["Delhi", "Noida", "Haryana"]
+    assert mapping["Gurugram"] == "Haryana"
+
+
+def test_collapse_locations_follows_chains_to_narrowest_requested_parent():
+    mapping = collapse_locations(["Noida", "Uttar Pradesh", "Delhi NCR", "India"])
+    assert kept(mapping) == ["India"]
+    mapping = collapse_locations(["Noida", "Uttar Pradesh", "Delhi NCR"])
+    assert mapping["Noida"] in ("Uttar Pradesh", "Delhi NCR")
+    assert kept(mapping) == ["Uttar Pradesh", "Delhi NCR"]
+
+
+def test_collapse_locations_folds_aliases_and_duplicates():
+    mapping = collapse_locations(["Gurgaon", "gurugram", " ", "Pune", "pune"])
+    assert mapping == {"Gurgaon": "Gurgaon", "gurugram": "Gurgaon", "Pune": "Pune", "pune": "Pune"}
+
+
+def test_qualified_place_reads_trailing_regions_as_qualifiers():
+    assert qualified_place(["Noida", "Uttar Pradesh", "India"]) == "Noida"
+    assert qualified_place(["Gurgaon", "Haryana"]) == "Gurgaon"
+    assert qualified_place(["Delhi", "Noida", "Gurugram", "Haryana"]) is None
+    assert qualified_place(["Haryana", "Faridabad"]) is None
+    assert qualified_place(["Noida"]) is None
+
+
+def test_merge_roles_merges_subsets_into_broader_role():
+    mapping = merge_roles(["Technical Recruiter", "Recruiter", "HR Manager", "hr-manager"])
+    assert mapping == {
+        "Technical Recruiter": "Recruiter",
+        "Recruiter": "Recruiter",
+        "HR Manager": "HR Manager",
+        "hr-manager": "HR Manager",
+    }
+
+
+def test_merge_roles_follows_chains_and_keeps_unrelated_roles():
+    mapping = merge_roles(["Senior Technical Recruiter", "Technical Recruiter", "Recruiter", "Talent Partner"])
+    assert kept(mapping) == ["Recruiter", "Talent Partner"]
+    assert mapping["Senior Technical Recruiter"] == "Recruiter"
+
+
+def test_plan_raises_result_cap_of_merged_roles():
+    plan = plan_queries(
+        ["Recruiter", "Technical Recruiter", "HR Manager", "hr manager"], ["Delhi NCR", "Noida"], ["linkedin"], []
+    )
+    assert plan["roles"] == ["Recruiter", "HR Manager"]
+    assert plan["role_weights"] == {"Recruiter": 2}
+    assert plan["locations"] == ["Delhi NCR"]
+    assert plan["location_covers"]["Delhi NCR"] == ["delhi/ncr", "ncr", "noida"]
+
+
+def test_plan_without_pruning_keeps_everything():
+    plan = plan_queries(["Recruiter", "Technical Recruiter"], ["Delhi NCR", "Noida"], ["linkedin"], [], prune=False)
+    assert plan["roles"] == ["Recruiter", "Technical Recruiter"]
+    assert plan["locations"] == ["Delhi NCR", "Noida"]
+    assert plan["role_weights"] == {}
+    assert plan["location_covers"] == {}
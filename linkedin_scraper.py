@@ -1,16 +1,26 @@
 ﻿from __future__ import annotations
 
+import hashlib
+import json
+import multiprocessing
+import os
 import re
+import threading
 import time
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from dataclasses import asdict, dataclass
 from datetime import datetime, timezone
-from typing import Dict, List, Optional
+from html import unescape
+from typing import Any, Dict, Iterable, Iterator, List, Optional
 from urllib.parse import quote_plus, unquote, urlparse
 
+import numpy as np
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-from openpyxl import load_workbook
+from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font
 from selenium import webdriver
 from selenium.common.exceptions import TimeoutException, WebDriverException
@@ -26,6 +36,30 @@ HEADLESS = True
 WAIT_SECONDS = 12
 SEARCH_PAGES = 1
 MAX_RESULTS_PER_KEYWORD = 10
+# Records are enriched and written in batches of this size, so memory does not grow with the run.
+RECORD_BATCH_SIZE = 200
+# Dedupe remembers this many recent (portal, job_url) keys; older ones are forgotten.
+DEDUPE_WINDOW = 200_000
+# Same cap as jobscrapper-backend/linkedin_scraper.py, which explains it.
+MAX_HYPERLINKS_PER_SHEET = 65_530
+# Detail pages are fetched on threads and parsed in worker processes.
+DETAIL_FETCH_WORKERS = 8
+DETAIL_PARSE_WORKERS = os.cpu_count() or 1
+DETAIL_PARSE_QUEUE_SIZE = DETAIL_PARSE_WORKERS * 2
+# Detail downloads are streamed and cut off after this many bytes.
+DETAIL_MAX_BYTES = 512 * 1024
+DETAIL_CHUNK_BYTES = 16 * 1024
+# Once a job-description container is seen, read only this much further.
+# Markers are matched as class/id attribute values, never as bare text.
+DETAIL_AFTER_MARKER_BYTES = 48 * 1024
+DETAIL_DESCRIPTION_MARKERS = [
+    b"jobDescriptionText",
+    b"show-more-less-html__markup",
+    b"description__text",
+    b"JobDetails_jobDescription",
+    b"job-desc",
+    b"styles_JDC__dang-inner-html",
+]
 LOCATION_QUERIES = [
     "Delhi, India",
     "Noida, Uttar Pradesh, India",
@@ -176,39 +210,166 @@ def normalize_tel(phone: str) -> Optional[str]:
     return "+" + re.sub(r"\D", "", digits_plus)
 
 
-def apply_excel_hyperlinks(path: str) -> None:
-    wb = load_workbook(path)
-    ws = wb.active
-
-    header_map = {ws.cell(row=1, column=c).value: c for c in range(1, ws.max_column + 1)}
-    url_col = header_map.get("job_url")
-    email_col = header_map.get("contact_email")
-    phone_col = header_map.get("contact_phone")
-
-    for r in range(2, ws.max_row + 1):
-        if url_col:
-            cell = ws.cell(row=r, column=url_col)
-            if cell.value and isinstance(cell.value, str) and cell.value.startswith("http"):
-                cell.hyperlink = cell.value
-                cell.font = Font(color="0563C1", underline="single")
-
-        if email_col:
-            cell = ws.cell(row=r, column=email_col)
-            if cell.value and isinstance(cell.value, str):
-                email = cell.value.strip().split(";")[0].strip()
-                if "@" in email:
-                    cell.hyperlink = f"mailto:{email}"
-                    cell.font = Font(color="0563C1", underline="single")
-
-        if phone_col:
-            cell = ws.cell(row=r, column=phone_col)
-            if cell.value and isinstance(cell.value, str):
-                phone = normalize_tel(cell.value.strip().split(";")[0].strip())
-                if phone:
-                    cell.hyperlink = f"tel:{phone}"
-                    cell.font = Font(color="0563C1", underline="single")
+# Vectorized equivalents of the per-row helpers above. They must return the
+# same values row for row; benchmarks/bench_postprocess.py checks this.
+LOCATION_KEYWORDS_PATTERN = "|".join(re.escape(k) for k in TARGET_LOCATION_KEYWORDS)
+
+
+def _text(values: pd.Series) -> pd.Series:
+    # Object dtype keeps .str on Python's re, as the per-row helpers use. Arrow
+    # strings (the pandas 3 default) run RE2, whose \d misses non-ASCII digits.
+    return values.fillna("").astype(str).astype(object)
+
+
+def _lower_text(values: pd.Series) -> pd.Series:
+    return _text(values).str.lower()
+
+
+def _per_unique(key):
+    """Evaluate a column transform once per distinct key(value) and broadcast it back.
+
+    Age labels, locations and contact details repeat heavily, so this shrinks
+    100k rows to a few hundred before any regex runs.
+    """
+
+    def decorate(fn):
+        def wrapper(values: pd.Series, *args, **kwargs) -> pd.Series:
+            codes, uniques = pd.factorize(key(values))
+            result = fn(pd.Series(uniques, dtype=object), *args, **kwargs)
+            return pd.Series(result.to_numpy()[codes], index=values.index, dtype=result.dtype)
+
+        return wrapper
+
+    return decorate
+
+
+@_per_unique(_lower_text)
+def parse_age_days_vec(t: pd.Series) -> pd.Series:
+
+    def number(pattern: str) -> pd.Series:
+        # int() rather than to_numeric, so non-ASCII digits parse as they do per row.
+        return t.str.extract(pattern, expand=False).map(int, na_action="ignore").astype(float)
+
+    hours = number(r"(\d+)\s*hour")
+    days = number(r"(\d+)\s*day")
+    weeks = number(r"(\d+)\s*week")
+    # Same precedence as parse_age_days: the first matching rule wins.
+    conditions = [
+        t.str.contains("just posted|today|new"),
+        t.str.contains(r"\d+\s*minute"),
+        hours.notna(),
+        days.notna(),
+        weeks.notna(),
+        t.str.contains("24 hours", regex=False),
+        t.str.contains("last 5 days|within 5 days"),
+    ]
+    choices = [0.0, 0.0, hours / 24, days, weeks * 7, 1.0, 5.0]
+    return pd.Series(np.select(conditions, choices, default=np.nan), index=t.index)
+
+
+def within_age_limit_vec(values: pd.Series, max_days: int = MAX_JOB_AGE_DAYS) -> pd.Series:
+    days = parse_age_days_vec(values)
+    return days.notna() & (days <= max_days)
+
+
+@_per_unique(_lower_text)
+def location_matches_vec(t: pd.Series) -> pd.Series:
+    return t.str.contains(LOCATION_KEYWORDS_PATTERN)
+
+
+@_per_unique(_text)
+def normalize_tel_vec(values: pd.Series) -> pd.Series:
+    digits_plus = values.str.replace(r"[^\d+]", "", regex=True)
+    digits = digits_plus.str.replace(r"\D", "", regex=True)
+    out = ("+" + digits).where(digits.str.len() != 10, "+91" + digits)
+    out = out.where(~digits_plus.str.startswith("+"), digits_plus)
+    return out.astype(object).where(digits_plus != "", None)
+
+
+@_per_unique(_text)
+def first_item_vec(values: pd.Series) -> pd.Series:
+    """First entry of a ';'-separated cell, as write_xlsx links emails and phones."""
+    return values.str.replace(r"(?s);.*", "", regex=True).str.strip()
+
+
+def filter_candidates(
+    candidates: List[Dict[str, Any]], max_days: int = MAX_JOB_AGE_DAYS, dedupe: bool = False
+) -> List[JobRecord]:
+    """Apply location, age and per-query result limits to scraped candidates in one batch.
+
+    Candidates carry ``_location_text`` (what location_matches is checked
+    against) and ``_unit`` (the scrape call or page MAX_RESULTS_PER_KEYWORD
+    applies to).
+    """
+    if not candidates:
+        return []
+    df = pd.DataFrame(candidates)
+    keep = location_matches_vec(df["_location_text"]) & within_age_limit_vec(df["date_posted"], max_days)
+    df = df[keep].groupby("_unit", sort=False).head(MAX_RESULTS_PER_KEYWORD)
+    if dedupe:
+        df = df.drop_duplicates(subset=["portal", "job_url"])
+    df = df.drop(columns=["_location_text", "_unit"]).astype(object)
+    df = df.where(df.notna(), None)
+    return [JobRecord(**row) for row in df.to_dict("records")]
+
+
+def hyperlink_targets(df: pd.DataFrame) -> pd.DataFrame:
+    """Hyperlink target per cell for the job_url, contact_email and contact_phone columns (None = no link)."""
+    targets = pd.DataFrame(index=df.index)
+    def strings(name: str) -> pd.Series:
+        # Only str cells are linked; anything else becomes "" so it never matches.
+        col = df[name]
+        if pd.api.types.infer_dtype(col, skipna=True) != "string":
+            col = col.where(np.fromiter((isinstance(v, str) for v in col), dtype=bool, count=len(col)), None)
+        return _text(col)
+
+    if "job_url" in df:
+        urls = strings("job_url")
+        targets["job_url"] = urls.astype(object).where(urls.str.startswith("http"), None)
+    if "contact_email" in df:
+        emails = first_item_vec(strings("contact_email"))
+        links = ("mailto:" + emails).astype(object)
+        targets["contact_email"] = links.where(emails.str.contains("@", regex=False), None)
+    if "contact_phone" in df:
+        tel = normalize_tel_vec(first_item_vec(strings("contact_phone")))
+        links = ("tel:" + tel.fillna("")).astype(object)
+        targets["contact_phone"] = links.where(tel.notna(), None)
+    return targets
+
+
+def write_xlsx(batches: Iterable[List[JobRecord]], path: str) -> int:
+    """Stream record batches into a write-only workbook, linking cells as they are written."""
+    wb = Workbook(write_only=True)
+    ws = wb.create_sheet()
+    header_font = Font(bold=True)
+    header = []
+    for name in OUTPUT_COLUMNS:
+        cell = WriteOnlyCell(ws, value=name)
+        cell.font = header_font
+        header.append(cell)
+    ws.append(header)
+    link_font = Font(color="0563C1", underline="single")
+    links = 0
+    count = 0
+
+    for batch in batches:
+        df = to_dataframe(batch)
+        targets = hyperlink_targets(df).reindex(columns=OUTPUT_COLUMNS).astype(object)
+        targets = targets.where(targets.notna(), None)
+        for values, row_targets in zip(df.itertuples(index=False), targets.itertuples(index=False)):
+            cells = []
+            for value, target in zip(values, row_targets):
+                if target is not None and links < MAX_HYPERLINKS_PER_SHEET:
+                    links += 1
+                    value = WriteOnlyCell(ws, value=value)
+                    value.hyperlink = target
+                    value.font = link_font
+                cells.append(value)
+            ws.append(cells)
+            count += 1
 
     wb.save(path)
+    return count
 
 
 def explain_portal_block(portal: str, text: str) -> None:
@@ -228,45 +389,353 @@ def looks_like_listing_url(url: str, portal: str) -> bool:
     return False
 
 
-def extract_generic_details(url: str) -> Dict[str, Optional[str]]:
+def _empty_details() -> Dict[str, Optional[str]]:
+    return {
+        "salary": None,
+        "email": None,
+        "phone": None,
+        "summary": None,
+        "employment_type": None,
+        "company": None,
+        "location": None,
+        "date_posted": None,
+    }
+
+
+def _description_marker_re() -> "re.Pattern[bytes]":
+    names = b"|".join(re.escape(m) for m in DETAIL_DESCRIPTION_MARKERS)
+    return re.compile(
+        rb"\b(?:class|id)\s*=\s*[\"'][^\"'>]*(?<![\w-])(?:" + names + rb")(?![\w-])",
+        flags=re.IGNORECASE,
+    )
+
+
+JSON_LD_OPEN_RE = re.compile(rb"<script[^>]+application/ld\+json[^>]*>", flags=re.IGNORECASE)
+SCRIPT_CLOSE_RE = re.compile(rb"</script\s*>", flags=re.IGNORECASE)
+
+
+def _read_capped(resp: requests.Response, max_bytes: int = DETAIL_MAX_BYTES) -> bytes:
+    """Read up to max_bytes, stopping early once the description has been read.
+
+    The early stop only applies once a complete JSON-LD block has been read,
+    so the structured data extract_structured_job prefers is never cut off,
+    even on pages that put it at the end of the body. Pages without JSON-LD
+    are read up to max_bytes.
+    """
+    marker_re = _description_marker_re()
+    body = bytearray()
+    stop_at = max_bytes
+    marker_scan = 0
+    ld_scan = 0
+    ld_open = False
+    ld_end = 0
+    for chunk in resp.iter_content(chunk_size=DETAIL_CHUNK_BYTES):
+        if not chunk:
+            continue
+        body.extend(chunk)
+        data = body
+
+        while True:
+            if ld_open:
+                m = SCRIPT_CLOSE_RE.search(data, ld_scan)
+            else:
+                m = JSON_LD_OPEN_RE.search(data, ld_scan)
+            if m is None:
+                # Leave room for a tag split across chunks.
+                ld_scan = max(ld_scan, len(data) - 256)
+                break
+            ld_open = not ld_open
+            ld_scan = m.end()
+            if not ld_open:
+                ld_end = ld_scan
+
+        if stop_at == max_bytes:
+            m = marker_re.search(data, marker_scan)
+            if m is not None:
+                stop_at = min(max_bytes, m.start() + DETAIL_AFTER_MARKER_BYTES)
+            else:
+                marker_scan = max(0, len(data) - 256)
+
+        if len(body) >= max_bytes or (len(body) >= stop_at and ld_end and not ld_open):
+            break
+    end = max(stop_at, ld_end) if ld_end and not ld_open else max_bytes
+    return bytes(body[: min(end, max_bytes)])
+
+
+def fetch_detail_html(url: str) -> Optional[str]:
     headers = {"User-Agent": USER_AGENT}
     try:
-        resp = requests.get(url, headers=headers, timeout=15, allow_redirects=True)
-        if resp.status_code >= 400:
-            return {"salary": None, "email": None, "phone": None, "summary": None, "employment_type": None}
-        soup = BeautifulSoup(resp.text, "html.parser")
-        body_text = soup.get_text(" ", strip=True)
-
-        salary = None
-        salary_patterns = [
-            r"\$\s?\d{2,3}[,\d]*(?:\s?-\s?\$\s?\d{2,3}[,\d]*)?",
-            r"\d{1,3}[,\d]*\s?(?:USD|INR|per year|per month|LPA)",
-        ]
-        for pattern in salary_patterns:
-            match = re.search(pattern, body_text, flags=re.IGNORECASE)
-            if match:
-                salary = match.group(0)
-                break
+        with requests.get(url, headers=headers, timeout=15, allow_redirects=True, stream=True) as resp:
+            if resp.status_code >= 400:
+                return None
+            content_type = resp.headers.get("Content-Type", "").lower()
+            if content_type and "html" not in content_type:
+                return None
+            body = _read_capped(resp)
+            encoding = resp.encoding if "charset" in content_type else "utf-8"
+            try:
+                return body.decode(encoding or "utf-8", errors="replace")
+            except LookupError:
+                # Unknown charset label (e.g. "charset=none").
+                return body.decode("utf-8", errors="replace")
+    except requests.RequestException:
+        return None
 
-        emp = None
-        for label in ["Full-time", "Part-time", "Contract", "Internship", "Temporary", "Remote"]:
-            if re.search(rf"\b{re.escape(label)}\b", body_text, flags=re.IGNORECASE):
-                emp = label
-                break
 
-        return {
-            "salary": salary,
-            "email": extract_email(body_text),
-            "phone": extract_phone(body_text),
-            "summary": summarize(body_text),
-            "employment_type": emp,
+JSON_LD_RE = re.compile(
+    r"<script[^>]+type=[\"']application/ld\+json[\"'][^>]*>(.*?)</script>",
+    flags=re.IGNORECASE | re.DOTALL,
+)
+MICRODATA_CONTENT_RE = re.compile(
+    r"<[^>]*\bitemprop=[\"'](\w+)[\"'][^>]*\bcontent=[\"']([^\"']*)[\"']"
+    r"|<[^>]*\bcontent=[\"']([^\"']*)[\"'][^>]*\bitemprop=[\"'](\w+)[\"']",
+    flags=re.IGNORECASE,
+)
+MICRODATA_TEXT_RE = re.compile(
+    r"<(\w+)[^>]*\bitemprop=[\"'](\w+)[\"'][^>]*>([^<]+)</\1>",
+    flags=re.IGNORECASE,
+)
+EMPLOYMENT_TYPE_LABELS = {
+    "FULL_TIME": "Full-time",
+    "PART_TIME": "Part-time",
+    "CONTRACTOR": "Contract",
+    "CONTRACT": "Contract",
+    "INTERN": "Internship",
+    "INTERNSHIP": "Internship",
+    "TEMPORARY": "Temporary",
+}
+
+
+def _strip_tags(value: str) -> str:
+    return " ".join(re.sub(r"<[^>]+>", " ", unescape(value or "")).split())
+
+
+def _iter_json_ld_nodes(data: Any):
+    if isinstance(data, list):
+        for item in data:
+            yield from _iter_json_ld_nodes(item)
+    elif isinstance(data, dict):
+        yield data
+        if "@graph" in data:
+            yield from _iter_json_ld_nodes(data["@graph"])
+
+
+def _is_job_posting(node: Dict[str, Any]) -> bool:
+    types = node.get("@type")
+    if isinstance(types, list):
+        return "JobPosting" in types
+    return types == "JobPosting"
+
+
+def _format_salary(base_salary: Any) -> Optional[str]:
+    if isinstance(base_salary, (str, int, float)):
+        return str(base_salary)
+    if not isinstance(base_salary, dict):
+        return None
+    currency = base_salary.get("currency") or ""
+    value = base_salary.get("value")
+    unit = ""
+    if isinstance(value, dict):
+        unit = str(value.get("unitText") or "").lower()
+        low, high = value.get("minValue"), value.get("maxValue")
+        amount = value.get("value")
+        if low is not None and high is not None:
+            amount = f"{low}-{high}"
+        elif amount is None:
+            amount = low if low is not None else high
+    else:
+        amount = value
+    if amount is None:
+        return None
+    text = f"{currency} {amount}".strip()
+    return f"{text} per {unit}" if unit else text
+
+
+def _format_employment_type(value: Any) -> Optional[str]:
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if not value:
+        return None
+    key = str(value).strip().upper().replace("-", "_").replace(" ", "_")
+    return EMPLOYMENT_TYPE_LABELS.get(key, str(value).strip())
+
+
+def _format_location(job_location: Any, location_type: Any = None) -> Optional[str]:
+    if isinstance(job_location, list):
+        parts = [_format_location(item) for item in job_location]
+        return "; ".join(p for p in parts if p) or None
+    if isinstance(job_location, str):
+        return job_location.strip() or None
+    if isinstance(job_location, dict):
+        address = job_location.get("address", job_location)
+        if isinstance(address, str):
+            return address.strip() or None
+        if isinstance(address, dict):
+            country = address.get("addressCountry")
+            if isinstance(country, dict):
+                country = country.get("name")
+            parts = [address.get("addressLocality"), address.get("addressRegion"), country]
+            return ", ".join(str(p) for p in parts if p) or None
+    if location_type and "TELECOMMUTE" in str(location_type).upper():
+        return "Remote"
+    return None
+
+
+def extract_structured_job(html: str) -> Dict[str, Optional[str]]:
+    """Read schema.org JobPosting fields from JSON-LD or microdata without a DOM."""
+    found: Dict[str, Optional[str]] = {}
+    for raw in JSON_LD_RE.findall(html):
+        try:
+            data = json.loads(raw.strip())
+        except ValueError:
+            continue
+        for node in _iter_json_ld_nodes(data):
+            if not _is_job_posting(node):
+                continue
+            org = node.get("hiringOrganization")
+            if isinstance(org, dict):
+                org = org.get("name")
+            found = {
+                "salary": _format_salary(node.get("baseSalary") or node.get("estimatedSalary")),
+                "employment_type": _format_employment_type(node.get("employmentType")),
+                "company": str(org).strip() if org else None,
+                "location": _format_location(node.get("jobLocation"), node.get("jobLocationType")),
+                "date_posted": str(node.get("datePosted") or "").strip() or None,
+                "description": _strip_tags(str(node.get("description") or "")) or None,
+            }
+            return found
+
+    if "itemprop" not in html:
+        return found
+    props: Dict[str, str] = {}
+    for name, content, content_alt, name_alt in MICRODATA_CONTENT_RE.findall(html):
+        props.setdefault(name or name_alt, content or content_alt)
+    for _tag, name, text in MICRODATA_TEXT_RE.findall(html):
+        props.setdefault(name, _strip_tags(text))
+    if not props:
+        return found
+    salary = props.get("baseSalary")
+    if props.get("currency") and (salary or props.get("value")):
+        salary = f"{props['currency']} {salary or props['value']}"
+    return {
+        "salary": salary or None,
+        "employment_type": _format_employment_type(props.get("employmentType")),
+        "company": props.get("hiringOrganization") or None,
+        "location": ", ".join(
+            props[k] for k in ("addressLocality", "addressRegion", "addressCountry") if props.get(k)
+        )
+        or None,
+        "date_posted": props.get("datePosted") or None,
+        "description": _strip_tags(props.get("description", "")) or None,
+    }
+
+
+def _regex_salary(text: str) -> Optional[str]:
+    salary_patterns = [
+        r"\$\s?\d{2,3}[,\d]*(?:\s?-\s?\$\s?\d{2,3}[,\d]*)?",
+        r"\d{1,3}[,\d]*\s?(?:USD|INR|per year|per month|LPA)",
+    ]
+    for pattern in salary_patterns:
+        match = re.search(pattern, text, flags=re.IGNORECASE)
+        if match:
+            return match.group(0)
+    return None
+
+
+def _regex_employment_type(text: str) -> Optional[str]:
+    for label in ["Full-time", "Part-time", "Contract", "Internship", "Temporary", "Remote"]:
+        if re.search(rf"\b{re.escape(label)}\b", text, flags=re.IGNORECASE):
+            return label
+    return None
+
+
+def parse_detail_html(html: str) -> Dict[str, Optional[str]]:
+    structured = extract_structured_job(html)
+    description = structured.get("description") or ""
+
+    details = _empty_details()
+    details.update(
+        {
+            "salary": structured.get("salary"),
+            "employment_type": structured.get("employment_type"),
+            "company": structured.get("company"),
+            "location": structured.get("location"),
+            "date_posted": structured.get("date_posted"),
+            "summary": summarize(description),
         }
-    except requests.RequestException:
-        return {"salary": None, "email": None, "phone": None, "summary": None, "employment_type": None}
+    )
+
+    # JobPosting has no contact fields, so email and phone always come from the
+    # flattened page; the regexes below only fill gaps structured data left.
+    body_text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+    details["salary"] = details["salary"] or _regex_salary(body_text)
+    details["employment_type"] = details["employment_type"] or _regex_employment_type(body_text)
+    details["summary"] = details["summary"] or summarize(body_text)
+    details["email"] = extract_email(body_text)
+    details["phone"] = extract_phone(body_text)
+    return details
 
 
-def scrape_linkedin_last24h(driver: webdriver.Chrome, keyword: str, location_query: str) -> List[JobRecord]:
-    records: List[JobRecord] = []
+def extract_generic_details(url: str) -> Dict[str, Optional[str]]:
+    html = fetch_detail_html(url)
+    if html is None:
+        return _empty_details()
+    return parse_detail_html(html)
+
+
+def fetch_details_pipelined(urls: List[str]) -> Dict[str, Dict[str, Optional[str]]]:
+    """Fetch detail pages on a thread pool and parse them on a process pool.
+
+    Fetch threads block once DETAIL_PARSE_QUEUE_SIZE pages are waiting to be
+    parsed, so memory stays bounded while every parser process stays busy.
+    Parser processes are spawned, not forked: the first submit happens on a
+    fetch thread while other threads are mid-request and hold locks that a
+    forked child would inherit.
+    """
+    pending = list(dict.fromkeys(u for u in urls if u))
+    results: Dict[str, Dict[str, Optional[str]]] = {}
+    if not pending:
+        return results
+    if DETAIL_PARSE_WORKERS <= 1:
+        return {url: extract_generic_details(url) for url in pending}
+
+    slots = threading.BoundedSemaphore(DETAIL_PARSE_QUEUE_SIZE)
+    with ProcessPoolExecutor(
+        max_workers=DETAIL_PARSE_WORKERS, mp_context=multiprocessing.get_context("spawn")
+    ) as parse_pool, ThreadPoolExecutor(
+        max_workers=DETAIL_FETCH_WORKERS
+    ) as fetch_pool:
+
+        def fetch_and_submit(url: str):
+            html = fetch_detail_html(url)
+            if html is None:
+                return url, None
+            slots.acquire()
+            future = parse_pool.submit(parse_detail_html, html)
+            future.add_done_callback(lambda _: slots.release())
+            return url, future
+
+        for url, future in fetch_pool.map(fetch_and_submit, pending):
+            results[url] = future.result() if future is not None else _empty_details()
+    return results
+
+
+def enrich_records(records: List[JobRecord]) -> None:
+    details_by_url = fetch_details_pipelined([r.job_url for r in records if r.job_url])
+    for record in records:
+        details = details_by_url.get(record.job_url or "") or _empty_details()
+        record.salary_package = details["salary"]
+        record.contact_email = details["email"]
+        record.contact_phone = details["phone"]
+        record.job_description_summary = details["summary"] or record.job_description_summary
+        record.employment_type = details["employment_type"]
+        record.company_name = record.company_name or details["company"]
+        record.job_location = record.job_location or details["location"]
+        record.date_posted = details["date_posted"] or record.date_posted
+
+
+def _collect_linkedin(driver: webdriver.Chrome, keyword: str, location_query: str) -> List[Dict[str, Any]]:
+    candidates: List[Dict[str, Any]] = []
     for page in range(SEARCH_PAGES):
         start = page * 25
         url = (
@@ -286,7 +755,6 @@ def scrape_linkedin_last24h(driver: webdriver.Chrome, keyword: str, location_que
 
         soup = BeautifulSoup(driver.page_source, "html.parser")
         cards = soup.select("li")
-        count = 0
         for card in cards:
             a = card.select_one("a.base-card__full-link[href]")
             if not a:
@@ -312,31 +780,28 @@ def scrape_linkedin_last24h(driver: webdriver.Chrome, keyword: str, location_que
                     break
 
             job_url = clean_url(a.get("href", ""))
-            if not location_matches(loc):
-                continue
-            if not within_age_limit(posted, max_days=MAX_JOB_AGE_DAYS):
-                continue
-            details = extract_generic_details(job_url)
-            records.append(
-                JobRecord(
-                    portal="LinkedIn",
-                    source_keyword=keyword,
-                    job_title=title,
-                    company_name=company,
-                    job_location=loc,
-                    date_posted=posted,
-                    salary_package=details["salary"],
-                    job_url=job_url,
-                    contact_email=details["email"],
-                    contact_phone=details["phone"],
-                    job_description_summary=details["summary"],
-                    employment_type=details["employment_type"],
-                    fetched_at_utc=datetime.now(timezone.utc).isoformat(),
-                )
+            record = JobRecord(
+                portal="LinkedIn",
+                source_keyword=keyword,
+                job_title=title,
+                company_name=company,
+                job_location=loc,
+                date_posted=posted,
+                job_url=job_url,
+                fetched_at_utc=datetime.now(timezone.utc).isoformat(),
             )
-            count += 1
-            if count >= MAX_RESULTS_PER_KEYWORD:
-                break
+            candidates.append(
+                {**asdict(record), "_location_text": loc, "_unit": f"LinkedIn|{keyword}|{location_query}|{page}"}
+            )
+    return candidates
+
+
+def scrape_linkedin_last24h(
+    driver: webdriver.Chrome, keyword: str, location_query: str, enrich: bool = True
+) -> List[JobRecord]:
+    records = filter_candidates(_collect_linkedin(driver, keyword, location_query), MAX_JOB_AGE_DAYS)
+    if enrich:
+        enrich_records(records)
     return records
 
 
@@ -349,8 +814,8 @@ def decode_yahoo_redirect(url: str) -> str:
     return unquote(m.group(1))
 
 
-def yahoo_site_results_last5d(portal_name: str, site_query: str, keyword: str) -> List[JobRecord]:
-    records: List[JobRecord] = []
+def _collect_yahoo(portal_name: str, site_query: str, keyword: str) -> List[Dict[str, Any]]:
+    candidates: List[Dict[str, Any]] = []
     query = (
         f'site:{site_query} "{keyword}" jobs '
         '"Delhi NCR" OR "Noida" OR "Gurgaon" OR "Gurugram" "last 5 days"'
@@ -390,8 +855,6 @@ def yahoo_site_results_last5d(portal_name: str, site_query: str, keyword: str) -
 
             snippet_node = block.select_one("div.compText")
             snippet = snippet_node.get_text(" ", strip=True) if snippet_node else ""
-            if not location_matches(f"{title or ''} {snippet}"):
-                continue
 
             date_posted = None
             m = re.search(
@@ -403,91 +866,129 @@ def yahoo_site_results_last5d(portal_name: str, site_query: str, keyword: str) -
                 date_posted = m.group(1)
             else:
                 date_posted = "Within 5 days (search-filtered)"
-            if not within_age_limit(date_posted, max_days=MAX_JOB_AGE_DAYS):
-                continue
 
-            details = extract_generic_details(real_url)
-            records.append(
-                JobRecord(
-                    portal=portal_name,
-                    source_keyword=keyword,
-                    job_title=title,
-                    company_name=None,
-                    job_location=None,
-                    date_posted=date_posted,
-                    salary_package=details["salary"],
-                    job_url=real_url,
-                    contact_email=details["email"],
-                    contact_phone=details["phone"],
-                    job_description_summary=details["summary"] or summarize(snippet),
-                    employment_type=details["employment_type"],
-                    fetched_at_utc=datetime.now(timezone.utc).isoformat(),
-                )
+            record = JobRecord(
+                portal=portal_name,
+                source_keyword=keyword,
+                job_title=title,
+                company_name=None,
+                job_location=None,
+                date_posted=date_posted,
+                job_url=real_url,
+                job_description_summary=summarize(snippet),
+                fetched_at_utc=datetime.now(timezone.utc).isoformat(),
             )
-            if len(records) >= MAX_RESULTS_PER_KEYWORD:
-                break
-        if len(records) >= MAX_RESULTS_PER_KEYWORD:
-            break
+            candidates.append(
+                {**asdict(record), "_location_text": f"{title or ''} {snippet}", "_unit": f"{portal_name}|{keyword}"}
+            )
+
+    return candidates
+
 
+def yahoo_site_results_last5d(
+    portal_name: str, site_query: str, keyword: str, enrich: bool = True
+) -> List[JobRecord]:
+    records = filter_candidates(_collect_yahoo(portal_name, site_query, keyword), MAX_JOB_AGE_DAYS)
+    if enrich:
+        enrich_records(records)
     return records
 
 
+OUTPUT_COLUMNS = [
+    "portal",
+    "source_keyword",
+    "job_title",
+    "company_name",
+    "job_location",
+    "date_posted",
+    "salary_package",
+    "job_url",
+    "contact_email",
+    "contact_phone",
+    "job_description_summary",
+    "employment_type",
+    "fetched_at_utc",
+]
+
+
 def to_dataframe(records: List[JobRecord]) -> pd.DataFrame:
     rows = [asdict(r) for r in records]
-    cols = [
-        "portal",
-        "source_keyword",
-        "job_title",
-        "company_name",
-        "job_location",
-        "date_posted",
-        "salary_package",
-        "job_url",
-        "contact_email",
-        "contact_phone",
-        "job_description_summary",
-        "employment_type",
-        "fetched_at_utc",
-    ]
     if not rows:
-        return pd.DataFrame(columns=cols)
+        return pd.DataFrame(columns=OUTPUT_COLUMNS)
     df = pd.DataFrame(rows)
-    for c in cols:
+    for c in OUTPUT_COLUMNS:
         if c not in df.columns:
             df[c] = None
-    return df[cols]
+    return df[OUTPUT_COLUMNS]
 
 
-def main() -> None:
-    print("[info] Starting HR jobs scrape for Delhi NCR/Noida/Gurgaon (last 24h to 5 days)")
-    driver = build_driver(headless=HEADLESS)
-    all_records: List[JobRecord] = []
+def iter_candidate_batches(driver: webdriver.Chrome) -> Iterator[List[Dict[str, Any]]]:
+    """One batch of raw candidates per LinkedIn search or Yahoo site query."""
+    for kw in HR_KEYWORDS:
+        for locq in LOCATION_QUERIES:
+            print(f"[info] LinkedIn: {kw} | {locq}")
+            yield _collect_linkedin(driver, kw, locq)
+
+        print(f"[info] Indeed last-5-days discovery: {kw}")
+        yield _collect_yahoo("Indeed", "indeed.com", kw)
+
+        print(f"[info] Naukri last-5-days discovery: {kw}")
+        yield _collect_yahoo("Naukri", "naukri.com", kw)
+
+        print(f"[info] Glassdoor last-5-days discovery: {kw}")
+        yield _collect_yahoo("Glassdoor", "glassdoor.com", kw)
+
+        time.sleep(1)
 
-    try:
-        for kw in HR_KEYWORDS:
-            for locq in LOCATION_QUERIES:
-                print(f"[info] LinkedIn: {kw} | {locq}")
-                all_records.extend(scrape_linkedin_last24h(driver, kw, locq))
 
-            print(f"[info] Indeed last-5-days discovery: {kw}")
-            all_records.extend(yahoo_site_results_last5d("Indeed", "indeed.com", kw))
+def iter_records(
+    batches: Iterable[List[Dict[str, Any]]], max_seen: int = DEDUPE_WINDOW
+) -> Iterator[JobRecord]:
+    """Filter each batch and drop (portal, job_url) pairs already seen in earlier batches.
 
-            print(f"[info] Naukri last-5-days discovery: {kw}")
-            all_records.extend(yahoo_site_results_last5d("Naukri", "naukri.com", kw))
+    Result limits apply per scrape call, so filtering batch by batch keeps
+    the same records as filtering everything at once. At most ``max_seen``
+    recent keys are remembered.
+    """
+    seen: "OrderedDict[bytes, None]" = OrderedDict()
+    for candidates in batches:
+        for record in filter_candidates(candidates, MAX_JOB_AGE_DAYS, dedupe=True):
+            key = f"{record.portal}\x1f{record.job_url}"
+            digest = hashlib.blake2b(key.encode("utf-8"), digest_size=16).digest()
+            if digest in seen:
+                seen.move_to_end(digest)
+                continue
+            seen[digest] = None
+            if len(seen) > max_seen:
+                seen.popitem(last=False)
+            yield record
+
+
+def iter_enriched_batches(records: Iterable[JobRecord]) -> Iterator[List[JobRecord]]:
+    batch: List[JobRecord] = []
+    for record in records:
+        batch.append(record)
+        if len(batch) >= RECORD_BATCH_SIZE:
+            print(f"[info] Enriching {len(batch)} job detail pages")
+            enrich_records(batch)
+            yield batch
+            batch = []
+    if batch:
+        print(f"[info] Enriching {len(batch)} job detail pages")
+        enrich_records(batch)
+        yield batch
 
-            print(f"[info] Glassdoor last-5-days discovery: {kw}")
-            all_records.extend(yahoo_site_results_last5d("Glassdoor", "glassdoor.com", kw))
 
-            time.sleep(1)
+def main() -> None:
+    print("[info] Starting HR jobs scrape for Delhi NCR/Noida/Gurgaon (last 24h to 5 days)")
+    driver = build_driver(headless=HEADLESS)
+    try:
+        # Scrape -> filter/dedupe -> enrich -> workbook, one batch at a time.
+        records = iter_records(iter_candidate_batches(driver))
+        count = write_xlsx(iter_enriched_batches(records), OUTPUT_FILE)
     finally:
         driver.quit()
-
-    df = to_dataframe(all_records)
-    if not df.empty:
-        df.drop_duplicates(subset=["portal", "job_url"], inplace=True)
-    df.to_excel(OUTPUT_FILE, index=False, engine="openpyxl")
-    apply_excel_hyperlinks(OUTPUT_FILE)
-    print(f"[done] Saved {len(df)} records to {OUTPUT_FILE}")
+    print(f"[done] Saved {count} records to {OUTPUT_FILE}")
 
 
 if __name__ == "__main__":